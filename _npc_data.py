@@ -0,0 +1,155 @@
+"""
+NPC definitions for The Gallery Silence.
+
+Split out of example_scenario so importing that module doesn't pay for
+these tables; they load lazily (PEP 562) on first use.
+"""
+
+from types import MappingProxyType
+
+from example_scenario import (ELIAS, NATHAN, HELENA, ARTHUR, LILA,
+                              INVESTIGATOR, FOYER, GALLERY, LIBRARY)
+
+
+NPC_KWARGS = (
+    # Nathan Cross - The Killer (poisons victim earlier, has alibi for moment of death)
+    dict(
+        name=NATHAN,
+        personality="Composed, socially confident, calculating. Maintains calm under pressure but becomes defensive when timeline is questioned.",
+        background="Guest at the gathering. Poisoned Elias's wine during casual conversation in sitting room.",
+        goals=[
+            "Maintain that he never poured Elias a drink",
+            "Claim he left the sitting room earlier than he did",
+            "Use his genuine alibi for moment of death as defense",
+            "Discredit or dismiss contradictory testimonies"
+        ],
+        fears=[
+            "Lila revealing she saw him pour the wine",
+            "Arthur exposing how long he was actually in sitting room",
+            "Timeline contradictions becoming undeniable",
+            "Being asked specific questions about wine glasses"
+        ],
+        secrets=[
+            "I poisoned Elias's wine during our conversation in the sitting room",
+            "The poison acts slowly - I knew he wouldn't die immediately",
+            "I deliberately stayed in other rooms when the poison would take effect",
+            "I was genuinely not in the gallery when he died - that's my defense",
+            "Lila saw me refill his glass, but she doesn't realize what it means",
+            "I was in the sitting room longer than I claim - Arthur can contradict me"
+        ],
+        current_location=FOYER,
+        emotional_state="Controlled concern",
+        relationships=MappingProxyType({
+            ELIAS: "The host, we were acquaintances",
+            HELENA: "Elias's sister, she was with me when he collapsed",
+            ARTHUR: "The estate manager, observant fellow",
+            LILA: "Another guest, an artist",
+            INVESTIGATOR: "The investigator looking into Elias's death"
+
+        })),
+
+    # Helena Morven - Victim's sister (emotionally close, observant but biased)
+    dict(
+        name=HELENA,
+        personality="Emotionally intense, protective of brother's memory, observant but grief-clouded. Tends to overstate certainty.",
+        background="Elias's sister. Was present throughout the evening and saw Elias drinking wine in the library.",
+        goals=[
+            "Find out what happened to her brother",
+            "Protect Elias's reputation",
+            "Share what she observed",
+            "Push for justice"
+        ],
+        fears=[
+            "Being dismissed as too emotional",
+            "Missing important details in her grief",
+            "Wrongly accusing someone",
+            "Not being taken seriously"
+        ],
+        secrets=[
+            "I saw Elias still drinking wine in the library during mid-evening",
+            "Nathan claims he left before that, but Elias was still drinking the wine from earlier",
+            "I was with Nathan in the dining room when Elias collapsed - I can confirm Nathan wasn't there",
+            "I sometimes exaggerate my certainty about things I only partially observed",
+            "I'm biased toward believing Nathan because he was with me during the death"
+        ],
+        current_location=GALLERY,
+        emotional_state="Grieving and determined",
+        relationships=MappingProxyType({
+            ELIAS: "My brother, we were very close",
+            NATHAN: "A guest, he was with me when Elias collapsed",
+            ARTHUR: "Elias's estate manager, reliable",
+            LILA: "Another guest, seemed detached",
+            INVESTIGATOR: "The investigator, I hope they find the truth"
+
+        })),
+
+    # Arthur Bell - Estate manager (practical, truthful, credible)
+    dict(
+        name=ARTHUR,
+        personality="Practical, observant, cautious with claims. Speaks precisely about what he saw and doesn't speculate beyond that.",
+        background="Estate manager for Elias. Present throughout evening and discovered the body.",
+        goals=[
+            "Provide accurate information",
+            "Stick to observed facts",
+            "Avoid speculation",
+            "Assist the investigation professionally"
+        ],
+        fears=[
+            "Being pressured to speculate",
+            "Misremembering details",
+            "Accusations of involvement",
+            "Failing Elias's memory"
+        ],
+        secrets=[
+            "I saw Nathan and Elias alone together in the sitting room",
+            "I didn't hear their conversation but noticed they were together longer than Nathan admits",
+            "I saw Elias stumble slightly later in the evening but dismissed it at the time",
+            "I discovered Elias collapsed in the gallery",
+            "Nathan was definitely still in the sitting room when he claims he'd left"
+        ],
+        current_location=GALLERY,
+        emotional_state="Somber and professional",
+        relationships=MappingProxyType({
+            ELIAS: "My employer, I managed his estate",
+            NATHAN: "A guest that evening",
+            HELENA: "Elias's sister, understandably distraught",
+            LILA: "A guest, an artist if I recall",
+            INVESTIGATOR: "The investigator, I'll help however I can"
+
+        })),
+
+    # Lila Chen - Artist guest (detached observer, key witness)
+    dict(
+        name=LILA,
+        personality="Observant, artistic, somewhat detached. Hesitant to make accusations but remembers visual details clearly.",
+        background="Guest artist invited to the gathering. Witnessed Nathan refill Elias's glass but didn't realize the significance.",
+        goals=[
+            "Share what she observed without overstepping",
+            "Avoid direct accusations unless certain",
+            "Maintain artistic objectivity",
+            "Help if pressed but not volunteer damaging information"
+        ],
+        fears=[
+            "Wrongly accusing someone",
+            "Being pulled into conflict",
+            "Overstating what she saw",
+            "Becoming a target herself"
+        ],
+        secrets=[
+            "I clearly saw Nathan refill Elias's glass in the sitting room",
+            "I thought it was just hospitality at the time",
+            "I didn't realize the significance until after Elias died",
+            "Nathan might not know I saw him do it",
+            "I'm hesitant to directly accuse Nathan because I don't want to be wrong"
+        ],
+        current_location=LIBRARY,
+        emotional_state="Uneasy and cautious",
+        relationships=MappingProxyType({
+            ELIAS: "The host, I didn't know him well",
+            NATHAN: "Another guest, seemed friendly enough",
+            HELENA: "Elias's sister, she's taking this very hard",
+            ARTHUR: "The estate manager, seems reliable",
+            INVESTIGATOR: "The investigator, I'll answer questions but I'm not comfortable making accusations"
+
+        })),
+)
@@ -4,75 +4,253 @@ AI Provider Interface
 Abstraction layer for different AI providers (OpenAI, Anthropic, etc.)
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import os
-from typing import Optional
-from abc import ABC, abstractmethod
+import re
+from collections import OrderedDict
+from typing import List, Optional
 
 
-class AIProvider(ABC):
-    """Abstract base class for AI providers"""
-    
-    @abstractmethod
+class ResponseCache:
+    """
+    In-process LRU cache for AI responses, keyed by the full request payload.
+
+    Identical prompts (common in tests, replays, and regression runs) skip the
+    network round-trip entirely. Disabled unless the DIALOGUE_CACHE environment
+    variable is set to "1".
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return os.getenv("DIALOGUE_CACHE") == "1"
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_prompt: str, max_tokens: int) -> str:
+        """Derive a stable cache key from the request parameters"""
+        payload = json.dumps({
+            "model": model,
+            "system": system_prompt,
+            "user": user_prompt,
+            "max_tokens": max_tokens
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached response, tracking hit/miss stats"""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response, evicting the least-recently-used entry if full"""
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    @property
+    def stats(self) -> dict:
+        """Hit/miss statistics for display in engine stats"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+# Shared cache for all providers in the process
+_response_cache = ResponseCache()
+
+# Shared httpx clients so re-instantiated providers reuse pooled keep-alive
+# connections instead of redoing the TLS handshake per scenario reload
+_http_client = None
+_async_http_client = None
+
+
+def _get_http_client():
+    """Create (once) and return the shared sync httpx client, or None if unavailable"""
+    global _http_client
+    if _http_client is None:
+        try:
+            import httpx
+            import atexit
+            _http_client = httpx.Client(
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100,
+                                    keepalive_expiry=30),
+                timeout=30
+            )
+            atexit.register(_http_client.close)
+        except ImportError:
+            pass
+    return _http_client
+
+
+def _get_async_http_client():
+    """Create (once) and return the shared async httpx client, or None if unavailable"""
+    global _async_http_client
+    if _async_http_client is None:
+        try:
+            import httpx
+            _async_http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100,
+                                    keepalive_expiry=30),
+                timeout=30
+            )
+        except ImportError:
+            pass
+    return _async_http_client
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the shared response cache (for stats display and tests)"""
+    return _response_cache
+
+
+class AIProvider:
+    """
+    Base class for AI providers.
+
+    A plain class rather than an ABC: duck typing avoids the ABCMeta
+    instantiation checks, which matter when providers are built per request.
+    """
+
+    # Providers that can yield partial output override this and stream_response
+    supports_streaming = False
+
     def generate_response(self, prompt: str, max_tokens: int = 500) -> str:
         """Generate a response from the AI"""
-        pass
+        raise NotImplementedError
+
+    def stream_response(self, prompt: str, max_tokens: int = 500):
+        """Yield response chunks as they arrive; default yields the full response once"""
+        yield self.generate_response(prompt, max_tokens)
 
 
 class OpenAIProvider(AIProvider):
     """OpenAI API provider"""
-    
+
+    supports_streaming = True
+
+    SYSTEM_PROMPT = "You are a character in a murder mystery game. Stay in character and respond naturally."
+
     def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4"):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.model = model
         self.client = None
-        
+        self._client_checked = False
+        # Constant across calls; build once instead of per request
+        self._system_msg = {"role": "system", "content": self.SYSTEM_PROMPT}
+
+    def _ensure_client(self) -> None:
+        """Import the openai SDK and build the client on first use"""
+        if self._client_checked:
+            return
+        self._client_checked = True
+
         if self.api_key:
             try:
                 from openai import OpenAI
-                self.client = OpenAI(api_key=self.api_key)
+                self.client = OpenAI(api_key=self.api_key, http_client=_get_http_client())
             except ImportError:
                 print("Warning: openai package not installed. Install with: pip install openai")
-    
+
     def generate_response(self, prompt: str, max_tokens: int = 500) -> str:
         """Generate a response using OpenAI"""
+        self._ensure_client()
         if not self.client:
             return "[OpenAI not configured - please set OPENAI_API_KEY and install openai package]"
-        
+
+        if _response_cache.enabled:
+            cache_key = ResponseCache.make_key(self.model, self.SYSTEM_PROMPT, prompt, max_tokens)
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": "You are a character in a murder mystery game. Stay in character and respond naturally."},
+                    self._system_msg,
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=max_tokens,
                 temperature=0.8
             )
-            return response.choices[0].message.content.strip()
+            text = response.choices[0].message.content.strip()
+            if _response_cache.enabled:
+                _response_cache.put(cache_key, text)
+            return text
         except Exception as e:
             return f"[OpenAI API Error: {str(e)}]"
 
+    def stream_response(self, prompt: str, max_tokens: int = 500):
+        """Stream response chunks from OpenAI as they arrive"""
+        self._ensure_client()
+        if not self.client:
+            yield "[OpenAI not configured - please set OPENAI_API_KEY and install openai package]"
+            return
+
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    self._system_msg,
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=max_tokens,
+                temperature=0.8,
+                stream=True
+            )
+            for chunk in stream:
+                yield chunk.choices[0].delta.content or ""
+        except Exception as e:
+            yield f"[OpenAI API Error: {str(e)}]"
+
 
 class AnthropicProvider(AIProvider):
     """Anthropic (Claude) API provider"""
-    
+
+    supports_streaming = True
+
     def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-sonnet-20240229"):
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self.model = model
         self.client = None
-        
+        self._client_checked = False
+
+    def _ensure_client(self) -> None:
+        """Import the anthropic SDK and build the client on first use"""
+        if self._client_checked:
+            return
+        self._client_checked = True
+
         if self.api_key:
             try:
                 from anthropic import Anthropic
-                self.client = Anthropic(api_key=self.api_key)
+                self.client = Anthropic(api_key=self.api_key, http_client=_get_http_client())
             except ImportError:
                 print("Warning: anthropic package not installed. Install with: pip install anthropic")
-    
+
     def generate_response(self, prompt: str, max_tokens: int = 500) -> str:
         """Generate a response using Anthropic Claude"""
+        self._ensure_client()
         if not self.client:
             return "[Anthropic not configured - please set ANTHROPIC_API_KEY and install anthropic package]"
-        
+
+        if _response_cache.enabled:
+            cache_key = ResponseCache.make_key(self.model, "", prompt, max_tokens)
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             response = self.client.messages.create(
                 model=self.model,
@@ -82,51 +260,481 @@ class AnthropicProvider(AIProvider):
                 ],
                 temperature=0.8
             )
+            text = response.content[0].text.strip()
+            if _response_cache.enabled:
+                _response_cache.put(cache_key, text)
+            return text
+        except Exception as e:
+            return f"[Anthropic API Error: {str(e)}]"
+
+    def stream_response(self, prompt: str, max_tokens: int = 500):
+        """Stream response chunks from Anthropic as they arrive"""
+        self._ensure_client()
+        if not self.client:
+            yield "[Anthropic not configured - please set ANTHROPIC_API_KEY and install anthropic package]"
+            return
+
+        try:
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.8
+            ) as stream:
+                for text in stream.text_stream:
+                    yield text
+        except Exception as e:
+            yield f"[Anthropic API Error: {str(e)}]"
+
+
+class AsyncAIProvider(AIProvider):
+    """
+    Base class for async providers.
+
+    Subclasses implement agenerate_response; generate_batch fires a list of
+    prompts concurrently so wall-clock time for N prompts approaches the
+    slowest single request instead of their sum.
+    """
+
+    async def agenerate_response(self, prompt: str, max_tokens: int = 500) -> str:
+        """Generate a response from the AI without blocking the event loop"""
+        raise NotImplementedError
+
+    def generate_response(self, prompt: str, max_tokens: int = 500) -> str:
+        """Synchronous fallback: run the async call to completion"""
+        return asyncio.run(self.agenerate_response(prompt, max_tokens))
+
+    async def generate_batch(self, prompts: List[str], max_tokens: int = 500,
+                             concurrency_limit: int = 8) -> List[str]:
+        """Generate responses for many prompts concurrently, bounded by a semaphore"""
+        semaphore = asyncio.Semaphore(concurrency_limit)
+
+        async def bounded(prompt: str) -> str:
+            async with semaphore:
+                return await self.agenerate_response(prompt, max_tokens)
+
+        return list(await asyncio.gather(*[bounded(p) for p in prompts]))
+
+
+class AsyncOpenAIProvider(AsyncAIProvider):
+    """Async OpenAI API provider for concurrent multi-NPC generation"""
+
+    SYSTEM_PROMPT = "You are a character in a murder mystery game. Stay in character and respond naturally."
+
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4"):
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.model = model
+        self.client = None
+        self._client_checked = False
+        # Constant across calls; build once instead of per request
+        self._system_msg = {"role": "system", "content": self.SYSTEM_PROMPT}
+
+    def _ensure_client(self) -> None:
+        """Import the openai SDK and build the async client on first use"""
+        if self._client_checked:
+            return
+        self._client_checked = True
+
+        if self.api_key:
+            try:
+                from openai import AsyncOpenAI
+                self.client = AsyncOpenAI(api_key=self.api_key, http_client=_get_async_http_client())
+            except ImportError:
+                print("Warning: openai package not installed. Install with: pip install openai")
+
+    async def agenerate_response(self, prompt: str, max_tokens: int = 500) -> str:
+        """Generate a response using OpenAI asynchronously"""
+        self._ensure_client()
+        if not self.client:
+            return "[OpenAI not configured - please set OPENAI_API_KEY and install openai package]"
+
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    self._system_msg,
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=max_tokens,
+                temperature=0.8
+            )
+            return response.choices[0].message.content.strip()
+        except Exception as e:
+            return f"[OpenAI API Error: {str(e)}]"
+
+
+class AsyncAnthropicProvider(AsyncAIProvider):
+    """Async Anthropic (Claude) API provider for concurrent multi-NPC generation"""
+
+    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-sonnet-20240229"):
+        self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        self.model = model
+        self.client = None
+        self._client_checked = False
+
+    def _ensure_client(self) -> None:
+        """Import the anthropic SDK and build the async client on first use"""
+        if self._client_checked:
+            return
+        self._client_checked = True
+
+        if self.api_key:
+            try:
+                from anthropic import AsyncAnthropic
+                self.client = AsyncAnthropic(api_key=self.api_key, http_client=_get_async_http_client())
+            except ImportError:
+                print("Warning: anthropic package not installed. Install with: pip install anthropic")
+
+    async def agenerate_response(self, prompt: str, max_tokens: int = 500) -> str:
+        """Generate a response using Anthropic Claude asynchronously"""
+        self._ensure_client()
+        if not self.client:
+            return "[Anthropic not configured - please set ANTHROPIC_API_KEY and install anthropic package]"
+
+        try:
+            response = await self.client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.8
+            )
             return response.content[0].text.strip()
         except Exception as e:
             return f"[Anthropic API Error: {str(e)}]"
 
 
+class CheckpointCacheProvider(AIProvider):
+    """
+    Disk-backed prompt->response cache wrapping another provider.
+
+    Long scenario replays repeat hundreds of prompts; persisting each
+    response to a JSONL file means an interrupted run resumes from where
+    it crashed without re-paying for earlier calls. Entries are appended
+    and fsynced as they arrive and reloaded on startup.
+    """
+
+    def __init__(self, provider: AIProvider, path: Optional[str] = None):
+        self.provider = provider
+        self.path = path or os.getenv("DIALOGUE_CACHE_PATH", "./cache.jsonl")
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Reload previously checkpointed responses, skipping corrupt lines"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    self._entries[record["k"]] = record["v"]
+                except (ValueError, KeyError):
+                    continue
+
+    def generate_response(self, prompt: str, max_tokens: int = 500) -> str:
+        """Return the checkpointed response if present, else call through and persist"""
+        model = getattr(self.provider, "model", "")
+        key = hashlib.sha256(f"{model}|{max_tokens}|{prompt}".encode("utf-8")).hexdigest()
+
+        if key in self._entries:
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        response = self.provider.generate_response(prompt, max_tokens)
+
+        # Don't checkpoint provider error strings; retry them next run
+        if not _is_error_response(response):
+            self._entries[key] = response
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"k": key, "v": response}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+        return response
+
+    def clear(self) -> int:
+        """Drop all cached entries (memory and disk); returns how many were removed"""
+        count = len(self._entries)
+        self._entries.clear()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        return count
+
+    @property
+    def stats(self) -> dict:
+        """Hit/miss statistics for display in engine stats"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+def _is_error_response(response: str) -> bool:
+    """Detect the bracketed error strings our providers return on failure"""
+    return response.startswith("[") and ("Error" in response or "not configured" in response)
+
+
+class PoolEndpoint:
+    """One endpoint in a PoolProvider: a provider plus live load tracking"""
+
+    def __init__(self, provider: AIProvider, concurrency_limit: int = 4):
+        self.provider = provider
+        self.concurrency_limit = max(1, concurrency_limit)
+        self.in_flight = 0
+        self.latency_ewma = 0.0  # seconds, exponentially weighted
+
+    @property
+    def load(self) -> float:
+        return self.in_flight / self.concurrency_limit
+
+    def record_latency(self, seconds: float) -> None:
+        """Fold a new sample into the EWMA so faster endpoints win ties"""
+        if self.latency_ewma == 0.0:
+            self.latency_ewma = seconds
+        else:
+            self.latency_ewma = 0.8 * self.latency_ewma + 0.2 * seconds
+
+
+class PoolProvider(AIProvider):
+    """
+    Fans requests across multiple endpoints with least-loaded dispatch.
+
+    Useful when one scenario drives many NPC turns and a single API key
+    hits rate limits: aggregate throughput becomes the sum of the
+    endpoints', and a failing endpoint fails over to the next-best one.
+    """
+
+    def __init__(self, endpoints: List[PoolEndpoint]):
+        if not endpoints:
+            raise ValueError("PoolProvider requires at least one endpoint")
+        self.endpoints = endpoints
+
+    def generate_response(self, prompt: str, max_tokens: int = 500) -> str:
+        """Dispatch to the least-loaded endpoint, failing over on errors"""
+        import time
+
+        last_response = ""
+        for endpoint in sorted(self.endpoints, key=lambda e: (e.load, e.latency_ewma)):
+            endpoint.in_flight += 1
+            start = time.perf_counter()
+            try:
+                response = endpoint.provider.generate_response(prompt, max_tokens)
+            except Exception as e:
+                last_response = f"[Pool endpoint error: {str(e)}]"
+                continue
+            finally:
+                endpoint.in_flight -= 1
+                endpoint.record_latency(time.perf_counter() - start)
+
+            if not _is_error_response(response):
+                return response
+            last_response = response
+
+        return last_response or "[All pool endpoints failed]"
+
+
+def _pool_provider_from_env(spec: str) -> Optional[PoolProvider]:
+    """
+    Build a PoolProvider from the AI_ENDPOINTS env var, a JSON list of
+    {"provider": "openai"|"anthropic", "model": ..., "api_key": ...,
+     "concurrency_limit": ...} objects. Returns None if the spec is invalid.
+    """
+    try:
+        entries = json.loads(spec)
+    except (ValueError, TypeError):
+        print("Warning: AI_ENDPOINTS is not valid JSON; ignoring")
+        return None
+
+    endpoints = []
+    try:
+        for entry in entries:
+            name = entry.get("provider", "openai").lower()
+            if name == "anthropic":
+                provider = AnthropicProvider(
+                    api_key=entry.get("api_key"),
+                    model=entry.get("model", "claude-3-sonnet-20240229")
+                )
+            else:
+                provider = OpenAIProvider(
+                    api_key=entry.get("api_key"),
+                    model=entry.get("model", "gpt-4")
+                )
+            endpoints.append(PoolEndpoint(provider, entry.get("concurrency_limit", 4)))
+    except (TypeError, AttributeError):
+        # Valid JSON of the wrong shape (not a list of objects)
+        print("Warning: AI_ENDPOINTS is not a JSON list of endpoint objects; ignoring")
+        return None
+
+    return PoolProvider(endpoints) if endpoints else None
+
+
+# Compiled once: a single regex scan replaces the 'in' check plus two
+# list-allocating str.split passes per prompt
+_CHAR_RE = re.compile(r"You are ([^,\n]+)")
+
+
+def _extract_character_name(prompt: str) -> str:
+    """Extract the character name from a dialogue prompt (e.g. 'You are Alice, ...')"""
+    match = _CHAR_RE.search(prompt)
+    return match.group(1).strip() if match else ""
+
+
+class SemanticCacheProvider(AIProvider):
+    """
+    Caching decorator that reuses responses for semantically similar prompts.
+
+    Players often paraphrase the same question ("where were you last night?"
+    vs "tell me what you did yesterday evening"); this layer embeds each
+    prompt locally and returns the cached response when the nearest stored
+    prompt is above the similarity threshold, skipping the remote call.
+    Entries are scoped per character so one NPC's answer never leaks to
+    another. Requires the optional sentence-transformers package; without it
+    the wrapper passes every call straight through.
+    """
+
+    def __init__(self, provider: AIProvider, threshold: float = 0.92, max_entries: int = 10000):
+        self.provider = provider
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        # character name -> (list of embeddings, list of responses)
+        self._entries: dict = {}
+        self._model = None
+        self._np = None
+
+        try:
+            from sentence_transformers import SentenceTransformer
+            import numpy as np
+            self._model = SentenceTransformer("all-MiniLM-L6-v2")
+            self._np = np
+        except ImportError:
+            print("Warning: sentence-transformers not installed. Semantic cache disabled. "
+                  "Install with: pip install sentence-transformers")
+
+    def _embed(self, text: str):
+        """Compute a normalized sentence embedding"""
+        return self._model.encode(text, normalize_embeddings=True)
+
+    def generate_response(self, prompt: str, max_tokens: int = 500) -> str:
+        """Return a cached response for a near-duplicate prompt, or delegate"""
+        if self._model is None:
+            return self.provider.generate_response(prompt, max_tokens)
+
+        scope = _extract_character_name(prompt)
+        embeddings, responses = self._entries.setdefault(scope, ([], []))
+
+        query = self._embed(prompt)
+        if embeddings:
+            similarities = self._np.dot(self._np.array(embeddings), query)
+            best = int(similarities.argmax())
+            if similarities[best] >= self.threshold:
+                self.hits += 1
+                return responses[best]
+
+        self.misses += 1
+        response = self.provider.generate_response(prompt, max_tokens)
+
+        embeddings.append(query)
+        responses.append(response)
+        if len(embeddings) > self.max_entries:
+            embeddings.pop(0)
+            responses.pop(0)
+
+        return response
+
+    @property
+    def stats(self) -> dict:
+        """Hit/miss statistics for display in engine stats"""
+        total = sum(len(responses) for _, responses in self._entries.values())
+        return {"hits": self.hits, "misses": self.misses, "size": total}
+
+
 class MockProvider(AIProvider):
     """Mock provider for testing without API keys"""
     
     def generate_response(self, prompt: str, max_tokens: int = 500) -> str:
         """Generate a mock response"""
         # Extract character name from prompt
-        if "You are " in prompt:
-            char_name = prompt.split("You are ")[1].split(",")[0].strip()
+        char_name = _extract_character_name(prompt)
+        if char_name:
             return f"[{char_name} responds - Mock AI: Please configure an AI provider]"
         return "[Mock AI Response - Please configure OPENAI_API_KEY or ANTHROPIC_API_KEY]"
 
 
-def get_ai_provider(provider_name: Optional[str] = None, model: Optional[str] = None) -> AIProvider:
+@functools.lru_cache(maxsize=8)
+def get_ai_provider(provider_name: Optional[str] = None, model: Optional[str] = None,
+                    use_async: bool = False) -> AIProvider:
     """
     Factory function to get the appropriate AI provider.
-    
+
+    Results are memoized per (provider_name, model, use_async) so scenario
+    reloads and repeated test calls reuse one SDK client instead of paying
+    client construction and TLS setup again; call
+    get_ai_provider.cache_clear() to force fresh providers (e.g. after
+    changing environment variables).
+
     Args:
         provider_name: 'openai', 'anthropic', or None (auto-detect)
         model: Specific model to use, or None for default
+        use_async: Return the async variant (supports generate_batch) where available
     """
+    # Snapshot the environment once: each os.getenv is a live os._Environ
+    # read, and a single .get-per-key also gives atomic semantics here
+    env = os.environ
+    semantic_cache = env.get("DIALOGUE_SEMANTIC_CACHE") == "1"
+    cache_path = env.get("DIALOGUE_CACHE_PATH")
+
     if provider_name is None:
-        provider_name = os.getenv("AI_PROVIDER", "").lower()
-    
+        provider_name = env.get("AI_PROVIDER", "").lower()
+
     # Auto-detect based on available API keys
     if not provider_name:
-        if os.getenv("OPENAI_API_KEY"):
+        if env.get("OPENAI_API_KEY"):
             provider_name = "openai"
-        elif os.getenv("ANTHROPIC_API_KEY"):
+        elif env.get("ANTHROPIC_API_KEY"):
             provider_name = "anthropic"
         else:
             provider_name = "mock"
-    
+
     # Get default model if not specified
     if model is None:
-        model = os.getenv("AI_MODEL", "")
+        model = env.get("AI_MODEL", "")
+
+    # A configured endpoint pool takes precedence over single providers
+    endpoints_spec = env.get("AI_ENDPOINTS")
+    if endpoints_spec:
+        pool = _pool_provider_from_env(endpoints_spec)
+        if pool is not None:
+            if semantic_cache:
+                return SemanticCacheProvider(pool)
+            return pool
     
     # Create provider
     if provider_name == "openai":
-        return OpenAIProvider(model=model or "gpt-4")
+        if use_async:
+            provider = AsyncOpenAIProvider(model=model or "gpt-4")
+        else:
+            provider = OpenAIProvider(model=model or "gpt-4")
     elif provider_name == "anthropic":
-        return AnthropicProvider(model=model or "claude-3-sonnet-20240229")
+        if use_async:
+            provider = AsyncAnthropicProvider(model=model or "claude-3-sonnet-20240229")
+        else:
+            provider = AnthropicProvider(model=model or "claude-3-sonnet-20240229")
     else:
-        return MockProvider()
+        provider = MockProvider()
+
+    # Optionally persist responses to disk so interrupted runs can resume
+    if cache_path:
+        provider = CheckpointCacheProvider(provider, path=cache_path)
+
+    # Optionally wrap with the semantic cache for near-duplicate prompts
+    if semantic_cache:
+        provider = SemanticCacheProvider(provider)
+
+    return provider
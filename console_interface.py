@@ -5,21 +5,41 @@ Standalone console interface for testing the dialogue engine.
 Allows interaction with NPCs without game integration.
 """
 
+import io
+import selectors
 import sys
+import traceback
 from typing import Optional
 from dialogue_engine import DialogueEngine
 from world_state import WorldState
 from npc_agent import NPCAgent, CharacterTrait
-from colorama import init, Fore, Style
 import os
 from version import __version__
 
-# Initialize colorama for colored output
-try:
-    init(autoreset=True)
-    COLORS_ENABLED = True
-except:
-    COLORS_ENABLED = False
+# Initialize colorama for colored output, but only for interactive terminals -
+# piped/CI runs skip the import entirely
+COLORS_ENABLED = False
+if sys.stdout.isatty():
+    try:
+        from colorama import init, Fore, Style
+        # No autoreset: we emit resets ourselves, so colorama doesn't have to
+        # wrap every print with an extra reset sequence
+        init(autoreset=False)
+        COLORS_ENABLED = True
+
+        import atexit
+        # Safety net: leave the terminal in its default state on exit
+        atexit.register(lambda: sys.stdout.write(Style.RESET_ALL))
+    except ImportError:
+        pass
+
+if not COLORS_ENABLED:
+    class _NoColor:
+        """Stand-in for colorama's Fore/Style that renders nothing"""
+        def __getattr__(self, name: str) -> str:
+            return ""
+
+    Fore = Style = _NoColor()
 
 
 class ConsoleInterface:
@@ -28,13 +48,66 @@ class ConsoleInterface:
     def __init__(self, engine: DialogueEngine):
         self.engine = engine
         self.current_npc: Optional[str] = None
-        self.player_name = "Detective"
+        self.player_name = sys.intern("Detective")
         self.running = True
-    
+
+        # Selector for the polling input path; built lazily on first read
+        self._selector = None
+
+        # (world_version, facts) memo for the /setting briefing
+        self._setting_cache = None
+
+        # O(1) command dispatch instead of an if/elif chain per keystroke
+        self._commands = {
+            '/quit': self._cmd_quit,
+            '/exit': self._cmd_quit,
+            '/help': self._cmd_help,
+            '/npcs': self._cmd_npcs,
+            '/talk': self._cmd_talk,
+            '/status': self._cmd_status,
+            '/lies': self._cmd_lies,
+            '/history': self._cmd_history,
+            '/timeline': self._cmd_timeline,
+            '/scene': self._cmd_scene,
+            '/world': self._cmd_world,
+            '/stats': self._cmd_stats,
+            '/setting': self._cmd_setting,
+            '/cache-clear': self._cmd_cache_clear,
+        }
+        # Frozen membership set: rejecting an unknown token is a single hash
+        # probe before any handler lookup
+        self._known_cmds = frozenset(self._commands)
+
+        # Optional prompt_toolkit session: line history + tab completion over
+        # commands and NPC names. Falls back to plain input() when missing.
+        self._session = None
+        if sys.stdout.isatty():
+            try:
+                from prompt_toolkit import PromptSession
+                from prompt_toolkit.history import FileHistory
+                history_path = os.path.expanduser("~/.dialogue_history")
+                self._session = PromptSession(history=FileHistory(history_path))
+            except ImportError:
+                pass
+
+        # Precompute ANSI-laden strings once rather than per loop iteration
+        self._reset = Style.RESET_ALL if COLORS_ENABLED else ""
+        self._green = Fore.GREEN if COLORS_ENABLED else ""
+        self._yellow = Fore.YELLOW if COLORS_ENABLED else ""
+        self._cyan = Fore.CYAN if COLORS_ENABLED else ""
+        self._magenta = Fore.MAGENTA if COLORS_ENABLED else ""
+        self._white = Fore.WHITE if COLORS_ENABLED else ""
+        if COLORS_ENABLED:
+            self._prompt_fmt = f"{Fore.YELLOW}[Talking to {{}}]{Style.RESET_ALL} > "
+            self._prompt_no_npc = f"{Fore.CYAN}[No NPC selected]{Style.RESET_ALL} > "
+        else:
+            self._prompt_fmt = "[{}] > "
+            self._prompt_no_npc = "> "
+
     def print_colored(self, text: str, color: str = "") -> None:
         """Print colored text if colors are enabled"""
         if COLORS_ENABLED and color:
-            print(f"{color}{text}{Style.RESET_ALL}")
+            sys.stdout.write(f"{color}{text}{self._reset}\n")
         else:
             print(text)
     
@@ -46,21 +119,25 @@ class ConsoleInterface:
     
     def print_npc(self, npc_name: str, text: str) -> None:
         """Print NPC dialogue"""
-        self.print_colored(f"\n{npc_name}: ", Fore.GREEN)
-        self.print_colored(f'  "{text}"', Fore.WHITE)
-    
+        sys.stdout.write(
+            f'\n{self._green}{npc_name}: {self._reset}\n'
+            f'{self._white}  "{text}"{self._reset}\n'
+        )
+
     def print_player(self, text: str) -> None:
         """Print player dialogue"""
-        self.print_colored(f"\n{self.player_name}: ", Fore.YELLOW)
-        self.print_colored(f'  "{text}"', Fore.WHITE)
-    
+        sys.stdout.write(
+            f'\n{self._yellow}{self.player_name}: {self._reset}\n'
+            f'{self._white}  "{text}"{self._reset}\n'
+        )
+
     def print_system(self, text: str) -> None:
         """Print system message"""
-        self.print_colored(f"\n[{text}]", Fore.CYAN)
-    
+        sys.stdout.write(f"\n{self._cyan}[{text}]{self._reset}\n")
+
     def print_debug(self, text: str) -> None:
         """Print debug information"""
-        self.print_colored(f"  DEBUG: {text}", Fore.MAGENTA)
+        sys.stdout.write(f"  {self._magenta}DEBUG: {text}{self._reset}\n")
     
     def show_welcome(self) -> None:
         """Show welcome message"""
@@ -79,6 +156,7 @@ class ConsoleInterface:
         print("  /scene <text>     - Set the current scene")
         print("  /world            - Show world state summary")
         print("  /stats            - Show engine statistics")
+        print("  /cache-clear      - Clear the persistent response cache")
         print("  /help             - Show this help message")
         print("  /quit or /exit    - Exit the program")
         print("\nType your message to talk to the current NPC, or use a command.\n")
@@ -91,13 +169,17 @@ class ConsoleInterface:
             return
         
         self.print_header("AVAILABLE NPCs")
+        buf = io.StringIO()
+        w = buf.write
         for npc_name in npcs:
             npc = self.engine.get_npc(npc_name)
             if npc:
-                print(f"\n  {npc.name}")
-                print(f"    Location: {npc.current_location}")
-                print(f"    Personality: {npc.personality}")
-                print(f"    Emotional State: {npc.emotional_state}")
+                w(f"\n  {npc.name}\n")
+                w(f"    Location: {npc.current_location}\n")
+                w(f"    Personality: {npc.personality}\n")
+                w(f"    Emotional State: {npc.emotional_state}\n")
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
     
     def show_npc_status(self, npc_name: str) -> None:
         """Show detailed NPC status"""
@@ -107,22 +189,26 @@ class ConsoleInterface:
             return
         
         self.print_header(f"STATUS: {status['name']}")
-        print(f"\n  Location: {status['location']}")
-        print(f"  Emotional State: {status['emotional_state']}")
-        print(f"  Conversation Turns: {status['conversation_turns']}")
-        print(f"  Total Memories: {status['memories']}")
-        print(f"  Lies Told: {status['lies_told']}")
-        print(f"  Omissions Made: {status['omissions_made']}")
-        
+        buf = io.StringIO()
+        w = buf.write
+        w(f"\n  Location: {status['location']}\n")
+        w(f"  Emotional State: {status['emotional_state']}\n")
+        w(f"  Conversation Turns: {status['conversation_turns']}\n")
+        w(f"  Total Memories: {status['memories']}\n")
+        w(f"  Lies Told: {status['lies_told']}\n")
+        w(f"  Omissions Made: {status['omissions_made']}\n")
+
         if status['goals']:
-            print(f"\n  Goals:")
+            w("\n  Goals:\n")
             for goal in status['goals']:
-                print(f"    - {goal}")
-        
+                w(f"    - {goal}\n")
+
         if status['secrets']:
-            print(f"\n  Secrets:")
+            w("\n  Secrets:\n")
             for secret in status['secrets']:
-                print(f"    - {secret}")
+                w(f"    - {secret}\n")
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
     
     def show_lies(self, npc_name: str) -> None:
         """Show lies told by an NPC"""
@@ -145,14 +231,19 @@ class ConsoleInterface:
             return
         
         self.print_header(f"CONVERSATION HISTORY: {npc_name}")
+
+        # Assemble the whole transcript and emit it in one write: one syscall
+        # instead of two per turn on a line-buffered terminal
+        parts = []
         for turn in history:
             speaker = turn['speaker']
             message = turn['message']
-            
-            if speaker == self.player_name:
-                self.print_colored(f"\n  {speaker}: \"{message}\"", Fore.YELLOW)
+            color = Fore.YELLOW if speaker == self.player_name else Fore.GREEN
+            if COLORS_ENABLED:
+                parts.append(f"\n  {color}{speaker}: \"{message}\"{self._reset}")
             else:
-                self.print_colored(f"\n  {speaker}: \"{message}\"", Fore.GREEN)
+                parts.append(f"\n  {speaker}: \"{message}\"")
+        sys.stdout.write("\n".join(parts) + "\n")
     
     def show_world_state(self) -> None:
         """Show world state summary"""
@@ -186,239 +277,327 @@ class ConsoleInterface:
             print(f"    Intentional Lies: {fc['intentional_lies']}")
             print(f"    Omissions: {fc['omissions']}")
             print(f"    Accuracy Rate: {fc['accuracy_rate']:.1f}%")
+
+        if 'response_cache' in stats:
+            rc = stats['response_cache']
+            print(f"\n  Response Cache:")
+            print(f"    Hits: {rc['hits']}")
+            print(f"    Misses: {rc['misses']}")
+            print(f"    Entries: {rc['size']}")
     
+    SETTING_FACT_KEYS = (
+        "time_period", "setting", "estate_name", "estate_type", "player_role",
+        "victim", "cause_of_death", "murder_location", "time_of_death",
+        "body_discovered_by", "discovery_time", "door_locked"
+    )
+
     def show_setting(self) -> None:
         """Show setting information and initial investigation report"""
         world = self.engine.world_state
-        
-        # Get setting facts
-        time_period = world.get_fact("time_period") or "Unknown"
-        setting = world.get_fact("setting") or "Unknown location"
-        estate_name = world.get_fact("estate_name") or "Unknown estate"
-        estate_type = world.get_fact("estate_type") or "Unknown"
-        player_role = world.get_fact("player_role") or "Investigator"
-        
+
+        # One bulk lookup instead of a dozen get_fact calls, memoized on the
+        # world version since the briefing facts are effectively immutable
+        if self._setting_cache is None or self._setting_cache[0] != world._world_version:
+            self._setting_cache = (world._world_version, world.get_facts(self.SETTING_FACT_KEYS))
+        facts = self._setting_cache[1]
+
+        time_period = facts.get("time_period") or "Unknown"
+        setting = facts.get("setting") or "Unknown location"
+        estate_name = facts.get("estate_name") or "Unknown estate"
+        estate_type = facts.get("estate_type") or "Unknown"
+        player_role = facts.get("player_role") or "Investigator"
+
         self.print_header("SETTING & INVESTIGATION BRIEFING")
-        
-        # Setting description
-        print(f"\n  TIME PERIOD: {time_period}")
-        print(f"  LOCATION: {estate_name}, {setting}")
-        print(f"  ESTATE TYPE: {estate_type}")
-        print(f"\n  YOUR ROLE: {player_role}")
-        
-        # Initial investigation report from on-site officer
-        self.print_colored("\n  === INITIAL INVESTIGATION REPORT ===", Fore.YELLOW)
-        self.print_colored("  From: On-site Officer", Fore.WHITE)
-        self.print_colored("  To: Investigating Detective\n", Fore.WHITE)
-        
+
+        yellow, white, reset = self._yellow, self._white, self._reset
+
+        # Accumulate the whole briefing and emit it in a single write
+        out = [
+            f"\n  TIME PERIOD: {time_period}",
+            f"  LOCATION: {estate_name}, {setting}",
+            f"  ESTATE TYPE: {estate_type}",
+            f"\n  YOUR ROLE: {player_role}",
+            f"\n  {yellow}=== INITIAL INVESTIGATION REPORT ==={reset}",
+            f"  {white}From: On-site Officer{reset}",
+            f"  {white}To: Investigating Detective{reset}\n",
+        ]
+
         # Get public murder facts
-        victim = world.get_fact("victim")
-        cause = world.get_fact("cause_of_death")
-        location = world.get_fact("murder_location")
-        time_of_death = world.get_fact("time_of_death")
-        discovered_by = world.get_fact("body_discovered_by")
-        discovery_time = world.get_fact("discovery_time")
-        door_locked = world.get_fact("door_locked")
-        
-        print(f"  VICTIM: {victim if victim else 'Unknown'}")
-        print(f"  CAUSE OF DEATH: {cause if cause else 'Under investigation'}")
-        print(f"  LOCATION: {location if location else 'Unknown'}")
-        print(f"  TIME OF DEATH: {time_of_death if time_of_death else 'Unknown'}")
-        print(f"\n  DISCOVERY:")
-        print(f"    - Body discovered by {discovered_by if discovered_by else 'unknown'} at {discovery_time if discovery_time else 'unknown time'}")
+        victim = facts.get("victim")
+        cause = facts.get("cause_of_death")
+        location = facts.get("murder_location")
+        time_of_death = facts.get("time_of_death")
+        discovered_by = facts.get("body_discovered_by")
+        discovery_time = facts.get("discovery_time")
+        door_locked = facts.get("door_locked")
+
+        out.append(f"  VICTIM: {victim if victim else 'Unknown'}")
+        out.append(f"  CAUSE OF DEATH: {cause if cause else 'Under investigation'}")
+        out.append(f"  LOCATION: {location if location else 'Unknown'}")
+        out.append(f"  TIME OF DEATH: {time_of_death if time_of_death else 'Unknown'}")
+        out.append("\n  DISCOVERY:")
+        out.append(f"    - Body discovered by {discovered_by if discovered_by else 'unknown'} at {discovery_time if discovery_time else 'unknown time'}")
         if door_locked:
-            print(f"    - {location} door found locked")
-        
+            out.append(f"    - {location} door found locked")
+
         # List occupants present
-        occupants = [char for char in world.characters if char != "Investigator"]
+        occupants = world.get_occupants()
         if occupants:
-            print(f"\n  OCCUPANTS PRESENT:")
-            for occupant in sorted(occupants):
-                print(f"    - {occupant}")
-        
+            out.append("\n  OCCUPANTS PRESENT:")
+            for occupant in occupants:
+                out.append(f"    - {occupant}")
+
         # Public events
         public_events = world.query_facts(category="murder", is_public=True)
         if len(public_events) > 3:  # More than just basic facts
-            print(f"\n  ADDITIONAL NOTES:")
-            print(f"    - Multiple witnesses present at estate")
-            print(f"    - All occupants have been secured on premises")
-            print(f"    - Await your arrival to conduct interviews")
-        
-        print(f"\n  OBJECTIVE: Question all occupants and determine the perpetrator.")
-        print(f"\n  Use /npcs to see who you can interview.")
-        
+            out.append("\n  ADDITIONAL NOTES:")
+            out.append("    - Multiple witnesses present at estate")
+            out.append("    - All occupants have been secured on premises")
+            out.append("    - Await your arrival to conduct interviews")
+
+        out.append("\n  OBJECTIVE: Question all occupants and determine the perpetrator.")
+        out.append("\n  Use /npcs to see who you can interview.")
+
+        sys.stdout.write('\n'.join(out) + '\n')
+        sys.stdout.flush()
+
     def show_timeline(self, npc_name: Optional[str] = None) -> None:
         """Show timeline/schedule for all NPCs or a specific NPC"""
         world = self.engine.world_state
-        
+
+        yellow, magenta, reset = self._yellow, self._magenta, self._reset
+
         if npc_name:
             # Show specific NPC's schedule
             npc = self.engine.get_npc(npc_name)
             if not npc:
                 self.print_system(f"NPC '{npc_name}' not found")
                 return
-            
+
             schedule = world.get_character_schedule(npc.name)
             if not schedule:
                 self.print_system(f"No schedule information for {npc.name}")
                 return
-            
+
             self.print_header(f"TIMELINE: {npc.name}")
             current_day = None
-            
+            out = []
+
             for entry in schedule:
                 if entry.time_block.day != current_day:
                     current_day = entry.time_block.day
-                    self.print_colored(f"\\n  === Day {current_day} ===", Fore.YELLOW)
-                
+                    out.append(f"\n  {yellow}=== Day {current_day} ==={reset}")
+
                 time_str = entry.time_block.period.replace('_', ' ').title()
-                print(f"\\n  {time_str}:")
-                print(f"    Location: {entry.location}")
-                print(f"    Activity: {entry.activity}")
-                
+                out.append(f"\n  {time_str}:")
+                out.append(f"    Location: {entry.location}")
+                out.append(f"    Activity: {entry.activity}")
+
                 if entry.with_characters:
-                    print(f"    With: {', '.join(entry.with_characters)}")
-                
+                    out.append(f"    With: {', '.join(entry.with_characters)}")
+
                 if entry.notes and not entry.is_public:
                     # Only show notes if they're private (for testing/debugging)
-                    self.print_colored(f"    [Private Note: {entry.notes}]", Fore.MAGENTA)
+                    out.append(f"    {magenta}[Private Note: {entry.notes}]{reset}")
         else:
             # Show timeline for all NPCs side-by-side
             self.print_header("COMPLETE TIMELINE - ALL OCCUPANTS")
-            
-            # Get all characters except Investigator
-            characters = [c for c in world.characters if c != "Investigator"]
-            
+
+            # Get all characters except Investigator (maintained, pre-sorted)
+            characters = world.get_occupants()
+
             if not characters:
                 self.print_system("No character schedules available")
                 return
-            
-            # Get all schedule entries
-            all_schedules = {}
-            for char in characters:
-                all_schedules[char] = world.get_character_schedule(char)
-            
-            # Group by day and time period
+
+            # Bucket every entry once so the day/period/character loops below
+            # do O(1) lookups instead of rescanning each schedule
+            index = {}
             days = set()
-            for schedules in all_schedules.values():
-                for entry in schedules:
-                    days.add(entry.time_block.day)
-            
+            occupied_slots = set()
+            for char in characters:
+                for entry in world.get_character_schedule(char):
+                    day = entry.time_block.day
+                    period = entry.time_block.period
+                    # First entry wins for a doubly-filed slot, matching the
+                    # world's own slot-table semantics
+                    index.setdefault((char, day, period), entry)
+                    days.add(day)
+                    occupied_slots.add((day, period))
+
+            out = []
+
             for day in sorted(days):
-                self.print_colored(f"\\n  === DAY {day} ===", Fore.YELLOW)
-                
+                out.append(f"\n  {yellow}=== DAY {day} ==={reset}")
+
                 for period in world.time_periods:
-                    # Check if any character has an entry for this period
-                    has_entries = any(
-                        any(e.time_block.day == day and e.time_block.period == period 
-                            for e in schedules)
-                        for schedules in all_schedules.values()
-                    )
-                    
-                    if not has_entries:
+                    if (day, period) not in occupied_slots:
                         continue
-                    
+
                     period_name = period.replace('_', ' ').title()
-                    print(f"\\n  {period_name}:")
-                    
-                    for char in sorted(characters):
-                        schedules = all_schedules[char]
-                        entry = next(
-                            (e for e in schedules 
-                             if e.time_block.day == day and e.time_block.period == period),
-                            None
-                        )
-                        
+                    out.append(f"\n  {period_name}:")
+
+                    for char in characters:
+                        entry = index.get((char, day, period))
+
                         if entry:
                             companions = f" (with {', '.join(entry.with_characters)})" if entry.with_characters else ""
-                            print(f"    {char:20s} -> {entry.location:15s} - {entry.activity}{companions}")
+                            out.append(f"    {char:20s} -> {entry.location:15s} - {entry.activity}{companions}")
                         else:
-                            print(f"    {char:20s} -> {'Unknown':15s}")
-            
-            print(f"\\n  Use /timeline <npc_name> to see detailed schedule for specific NPC.")
-            
+                            out.append(f"    {char:20s} -> {'Unknown':15s}")
+
+            out.append("\n  Use /timeline <npc_name> to see detailed schedule for specific NPC.")
+
+        # One write + one flush regardless of how long the listing is
+        sys.stdout.write('\n'.join(out) + '\n')
+        sys.stdout.flush()
+
+    def resolve_npc(self, name: str):
+        """
+        Resolve an NPC by case-insensitive name, falling back to a unique
+        prefix match so '/talk lady' finds 'Lady Ashworth'.
+        """
+        npc = self.engine.get_npc(name)
+        if npc:
+            return npc
+
+        prefix = name.lower()
+        matches = [key for key in self.engine.npcs if key.startswith(prefix)]
+        if len(matches) == 1:
+            return self.engine.npcs[matches[0]]
+        if len(matches) > 1:
+            ambiguous = ", ".join(self.engine.npcs[m].name for m in sorted(matches))
+            self.print_system(f"Ambiguous name '{name}' - could be: {ambiguous}")
+        return None
+
+    def _cmd_quit(self, arg: str) -> None:
+        self.print_system("Goodbye!")
+        self.running = False
+
+    def _cmd_help(self, arg: str) -> None:
+        self.show_welcome()
+
+    def _cmd_npcs(self, arg: str) -> None:
+        self.show_npcs()
+
+    def _cmd_talk(self, arg: str) -> None:
+        if not arg:
+            self.print_system("Usage: /talk <npc_name>")
+            return
+        npc = self.resolve_npc(arg)
+        if npc:
+            self.current_npc = npc.name
+            self.print_system(f"Now talking to {npc.name}")
+            self.print_colored(f"\nYou approach {npc.name}...\n", Fore.CYAN)
+        else:
+            self.print_system(f"NPC '{arg}' not found. Use /npcs to see available NPCs.")
+
+    def _cmd_status(self, arg: str) -> None:
+        if not arg:
+            self.print_system("Usage: /status <npc_name>")
+        else:
+            self.show_npc_status(arg)
+
+    def _cmd_lies(self, arg: str) -> None:
+        if not arg:
+            self.print_system("Usage: /lies <npc_name>")
+        else:
+            self.show_lies(arg)
+
+    def _cmd_history(self, arg: str) -> None:
+        if not arg:
+            self.print_system("Usage: /history <npc_name>")
+        else:
+            self.show_history(arg)
+
+    def _cmd_timeline(self, arg: str) -> None:
+        # arg is optional - can show all or specific NPC
+        self.show_timeline(arg if arg else None)
+
+    def _cmd_scene(self, arg: str) -> None:
+        if not arg:
+            self.print_system("Usage: /scene <description>")
+        else:
+            self.engine.set_scene(arg)
+            self.print_system(f"Scene set: {arg}")
+
+    def _cmd_world(self, arg: str) -> None:
+        self.show_world_state()
+
+    def _cmd_stats(self, arg: str) -> None:
+        self.show_stats()
+
+    def _cmd_setting(self, arg: str) -> None:
+        self.show_setting()
+
+    def _cmd_cache_clear(self, arg: str) -> None:
+        provider = self.engine.ai_provider
+        # Unwrap cache decorators until we find one that can clear
+        while provider is not None:
+            if hasattr(provider, 'clear'):
+                removed = provider.clear()
+                self.print_system(f"Cleared {removed} cached responses")
+                return
+            provider = getattr(provider, 'provider', None)
+        self.print_system("No persistent cache configured (set DIALOGUE_CACHE_PATH)")
+
     def handle_command(self, command: str) -> bool:
         """
         Handle a command. Returns True if command was processed.
         """
-        parts = command.strip().split(maxsplit=1)
-        cmd = parts[0].lower()
-        arg = parts[1] if len(parts) > 1 else ""
-        
-        if cmd in ['/quit', '/exit']:
-            self.print_system("Goodbye!")
-            self.running = False
-            return True
-        
-        elif cmd == '/help':
-            self.show_welcome()
-            return True
-        
-        elif cmd == '/npcs':
-            self.show_npcs()
-            return True
-        
-        elif cmd == '/talk':
-            if not arg:
-                self.print_system("Usage: /talk <npc_name>")
-            else:
-                npc = self.engine.get_npc(arg)
-                if npc:
-                    self.current_npc = npc.name
-                    self.print_system(f"Now talking to {npc.name}")
-                    self.print_colored(f"\nYou approach {npc.name}...\n", Fore.CYAN)
-                else:
-                    self.print_system(f"NPC '{arg}' not found. Use /npcs to see available NPCs.")
-            return True
-        
-        elif cmd == '/status':
-            if not arg:
-                self.print_system("Usage: /status <npc_name>")
-            else:
-                self.show_npc_status(arg)
-            return True
-        
-        elif cmd == '/lies':
-            if not arg:
-                self.print_system("Usage: /lies <npc_name>")
-            else:
-                self.show_lies(arg)
-            return True
-        
-        elif cmd == '/history':
-            if not arg:
-                self.print_system("Usage: /history <npc_name>")
-            else:
-                self.show_history(arg)
-            return True
-        
-        elif cmd == '/timeline':
-            # arg is optional - can show all or specific NPC
-            self.show_timeline(arg if arg else None)
-            return True
-        
-        elif cmd == '/scene':
-            if not arg:
-                self.print_system("Usage: /scene <description>")
-            else:
-                self.engine.set_scene(arg)
-                self.print_system(f"Scene set: {arg}")
-            return True
-        
-        elif cmd == '/world':
-            self.show_world_state()
-            return True
-        
-        elif cmd == '/stats':
-            self.show_stats()
-            return True
-        
-        elif cmd == '/setting':
-            self.show_setting()
-            return True
-        
-        return False
-    
+        # partition avoids the list allocation of split(maxsplit=1)
+        cmd, _, arg = command.strip().partition(' ')
+        cmd = cmd.lower()
+        if cmd not in self._known_cmds:
+            return False
+        self._commands[cmd](arg.lstrip())
+        return True
+
+    def read_input(self, prompt: str) -> str:
+        """
+        Read a line of input, using prompt_toolkit (history + tab completion
+        over commands and NPC names) when available, else plain input().
+        """
+        if self._session is None:
+            return self._poll_input(prompt)
+
+        from prompt_toolkit.completion import WordCompleter
+        from prompt_toolkit.formatted_text import ANSI
+
+        commands = ['/talk', '/npcs', '/status', '/lies', '/history', '/timeline',
+                    '/setting', '/scene', '/world', '/stats', '/cache-clear',
+                    '/help', '/quit', '/exit']
+        # Rebuild per prompt so newly added NPCs complete immediately
+        completer = WordCompleter(commands + self.engine.get_all_npcs(), sentence=True)
+        return self._session.prompt(ANSI(prompt), completer=completer)
+
+    def _poll_input(self, prompt: str) -> str:
+        """
+        Read a line from stdin via a selector poll loop instead of a blocking
+        input() call, so KeyboardInterrupt is serviced promptly and future
+        background work (cache flushes, streamed chunks) can run between
+        polls. Falls back to input() where stdin isn't selectable (Windows).
+        """
+        if self._selector is None:
+            try:
+                self._selector = selectors.DefaultSelector()
+                self._selector.register(sys.stdin, selectors.EVENT_READ)
+            except (ValueError, OSError, PermissionError):
+                self._selector = False  # not selectable; remember that
+
+        if self._selector is False:
+            return input(prompt)
+
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        while True:
+            events = self._selector.select(timeout=0.05)
+            if events:
+                line = sys.stdin.readline()
+                if line == "":
+                    raise EOFError
+                return line.rstrip("\n")
+
     def run(self) -> None:
         """Main console loop"""
         self.show_welcome()
@@ -427,18 +606,19 @@ class ConsoleInterface:
             try:
                 # Show prompt
                 if self.current_npc:
-                    prompt = f"{Fore.YELLOW}[Talking to {self.current_npc}]{Style.RESET_ALL} > " if COLORS_ENABLED else f"[{self.current_npc}] > "
+                    prompt = self._prompt_fmt.format(self.current_npc)
                 else:
-                    prompt = f"{Fore.CYAN}[No NPC selected]{Style.RESET_ALL} > " if COLORS_ENABLED else "> "
+                    prompt = self._prompt_no_npc
                 
-                user_input = input(prompt).strip()
+                user_input = self.read_input(prompt).strip()
                 
                 if not user_input:
                     continue
                 
-                # Check if it's a command
-                if user_input.startswith('/'):
-                    self.handle_command(user_input)
+                # Check if it's a command: one char peek, one set lookup
+                if user_input[:1] == '/':
+                    if not self.handle_command(user_input):
+                        self.print_system("Unknown command. Type /help for a list.")
                     continue
                 
                 # Must have an NPC selected to talk
@@ -449,31 +629,50 @@ class ConsoleInterface:
                 # Show player message
                 self.print_player(user_input)
                 
-                # Get NPC response
-                response, metadata = self.engine.converse(
-                    self.current_npc,
-                    user_input,
-                    self.player_name
-                )
-                
-                # Show NPC response
-                self.print_npc(self.current_npc, response)
+                # Get NPC response, streaming tokens live when supported
+                if self.engine.ai_provider.supports_streaming:
+                    self.print_colored(f"\n{self.current_npc}: ", Fore.GREEN)
+                    sys.stdout.write('  "')
+                    sys.stdout.flush()
+
+                    def show_chunk(chunk: str) -> None:
+                        sys.stdout.write(chunk)
+                        sys.stdout.flush()
+
+                    response, metadata = self.engine.converse(
+                        self.current_npc,
+                        user_input,
+                        self.player_name,
+                        on_chunk=show_chunk
+                    )
+                    sys.stdout.write('"\n')
+                else:
+                    response, metadata = self.engine.converse(
+                        self.current_npc,
+                        user_input,
+                        self.player_name
+                    )
+
+                    # Show NPC response
+                    self.print_npc(self.current_npc, response)
                 
                 # Show validation info if in verbose mode
                 if self.engine.verbose and metadata.get('validation_results'):
                     self.print_debug("Validation Results:")
                     for result in metadata['validation_results']:
-                        status = "✓" if result['is_valid'] else "✗"
-                        flag = " [LIE]" if result['is_lie'] else (" [OMISSION]" if result['is_omission'] else "")
-                        self.print_debug(f"{status} {result['claim']}{flag}")
+                        status = "✓" if result.is_valid else "✗"
+                        flag = " [LIE]" if result.is_lie else (" [OMISSION]" if result.is_omission else "")
+                        self.print_debug(f"{status} {result.claim}{flag}")
             
             except KeyboardInterrupt:
                 print("\n")
                 self.print_system("Use /quit to exit")
+            except EOFError:
+                self.print_system("End of input - goodbye!")
+                self.running = False
             except Exception as e:
                 self.print_system(f"Error: {str(e)}")
                 if self.engine.verbose:
-                    import traceback
                     traceback.print_exc()
 
 
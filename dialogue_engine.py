@@ -5,14 +5,44 @@ Main engine that orchestrates conversations between the player and NPCs.
 Handles AI generation, fact-checking, and memory management.
 """
 
+from bisect import insort
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Any, Tuple
 from world_state import WorldState
 from npc_agent import NPCAgent
 from fact_checker import FactChecker, IntentionAnalyzer
-from ai_provider import AIProvider, get_ai_provider
+from ai_provider import AIProvider, get_ai_provider, get_response_cache, _is_error_response
 import os
+import sys
 from dotenv import load_dotenv
 
+# load_dotenv touches the filesystem; do it once per process, not once per
+# engine, so constructing additional engines is free
+_DOTENV_LOADED = False
+
+
+def _ensure_dotenv() -> None:
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationEntry:
+    """
+    Compact per-claim validation record exposed in converse() metadata.
+
+    A frozen slotted struct instead of a dict: attribute access is faster
+    than hashed key lookups for consumers iterating many results, and
+    there's no per-instance __dict__ to allocate.
+    """
+    claim: str
+    is_valid: bool
+    is_lie: bool
+    is_omission: bool
+    reason: str
+
 
 class DialogueEngine:
     """
@@ -36,29 +66,78 @@ class DialogueEngine:
             enable_fact_checking: Whether to validate NPC claims
             verbose: Print debug information
         """
-        load_dotenv()  # Load environment variables
+        _ensure_dotenv()  # Load environment variables (first engine only)
         
         self.world_state = world_state
         self.npcs: Dict[str, NPCAgent] = {}
         self.fact_checker = FactChecker(world_state) if enable_fact_checking else None
         self.ai_provider = ai_provider or get_ai_provider()
         self.verbose = verbose
+        # Building the per-turn ValidationEntry list is pure output; skip it
+        # unless someone (verbose mode, a debug UI) will actually read it
+        self.collect_validation_results = verbose
         self.current_scene = ""
+
+        # Reusable base for the per-turn metadata dict built in converse
+        self._metadata_template = {
+            "npc_name": None,
+            "validation_enabled": self.fact_checker is not None
+        }
         
         # Conversation state
         self.active_conversations: Dict[str, List[Dict[str, str]]] = {}
-        
+
+        # Sorted roster maintained on add_npc so get_all_npcs is a plain read
+        self._npc_names: List[str] = []
+
+        # Memoized name resolution: raw query string -> NPC (or None), plus a
+        # one-slot fast path for the repeated same-NPC queries a conversation
+        # produces. Both are invalidated whenever the roster changes.
+        self._npc_resolve_cache: Dict[str, Optional[NPCAgent]] = {}
+        self._last_npc_query: Optional[str] = None
+        self._last_npc: Optional[NPCAgent] = None
+
+        # npc name -> world version at last knowledge sync; lets converse
+        # skip the O(facts+events) re-sync while the world is unchanged
+        self._sync_cache: Dict[str, int] = {}
+
+        # npc name -> (entries consumed, serialized view); get_npc_lies and
+        # get_npc_omissions append only the new tail instead of rebuilding
+        self._lies_view_cache: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+        self._omissions_view_cache: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+
     def add_npc(self, npc: NPCAgent) -> None:
         """Register an NPC with the dialogue engine"""
-        self.npcs[npc.name.lower()] = npc
+        # Intern the name: it recurs as a dict key and in comparisons across
+        # memories, events and schedules, so all copies share one object
+        npc.name = sys.intern(npc.name)
+        key = sys.intern(npc.name.lower())
+        if key not in self.npcs:
+            insort(self._npc_names, npc.name)
+        self.npcs[key] = npc
         self.world_state.add_character(npc.name)
-        
+
+        self._npc_resolve_cache.clear()
+        self._last_npc_query = None
+        self._last_npc = None
+
         if self.verbose:
             print(f"[Engine] Registered NPC: {npc.name}")
-    
+
     def get_npc(self, npc_name: str) -> Optional[NPCAgent]:
         """Get an NPC by name (case-insensitive)"""
-        return self.npcs.get(npc_name.lower())
+        if npc_name == self._last_npc_query:
+            return self._last_npc
+
+        if npc_name in self._npc_resolve_cache:
+            npc = self._npc_resolve_cache[npc_name]
+        else:
+            npc = self.npcs.get(npc_name.lower())
+            self._npc_resolve_cache[npc_name] = npc
+
+        self._last_npc_query = npc_name
+        self._last_npc = npc
+        return npc
     
     def set_scene(self, scene_description: str) -> None:
         """Set the current scene description"""
@@ -69,31 +148,44 @@ class DialogueEngine:
     def sync_npc_knowledge(self, npc: NPCAgent) -> None:
         """
         Synchronize an NPC's knowledge with what they should know from world state.
+        Re-syncs only when the world state has changed since the last sync.
         """
+        world_version = self.world_state._world_version
+        if self._sync_cache.get(npc.name) == world_version:
+            return
+
         knowledge = self.world_state.export_character_knowledge(npc.name)
-        
-        # Update NPC's known facts
+
+        # Update NPC's known facts, interning the repeated key/value strings
         for fact in knowledge['known_facts']:
-            npc.add_known_fact(fact['key'], fact['value'])
-        
+            value = fact['value']
+            if isinstance(value, str):
+                value = sys.intern(value)
+            npc.add_known_fact(sys.intern(fact['key']), value)
+
         # Update witnessed events
         for event in knowledge['known_events']:
-            npc.add_witnessed_event(event['id'])
+            npc.add_witnessed_event(sys.intern(event['id']))
+
+        self._sync_cache[npc.name] = world_version
     
     def converse(
         self,
         npc_name: str,
         player_message: str,
-        player_name: str = "Player"
+        player_name: str = "Player",
+        on_chunk: Optional[Any] = None
     ) -> Tuple[str, Dict[str, Any]]:
         """
         Have a conversation turn with an NPC.
-        
+
         Args:
             npc_name: Name of the NPC to talk to
             player_message: What the player said
             player_name: Name to use for the player
-        
+            on_chunk: Optional callable receiving response chunks as they
+                stream in (only used when the provider supports streaming)
+
         Returns:
             Tuple of (npc_response, metadata)
             metadata contains validation results, lies detected, etc.
@@ -111,15 +203,36 @@ class DialogueEngine:
         # Record player's message
         npc.add_conversation_turn(player_name, player_message)
         
-        # Generate AI prompt with character knowledge
-        prompt = npc.get_dialogue_prompt(player_message, self.current_scene, character_knowledge)
-        
-        if self.verbose:
-            print(f"\n[Engine] Generating response for {npc.name}")
-            print(f"[Engine] Player said: {player_message}")
-        
-        # Get AI response
-        npc_response = self.ai_provider.generate_response(prompt)
+        # Compiled-skill fast path: a question this NPC has answered the
+        # same way repeatedly is served without prompt assembly or AI call
+        npc_response = npc.lookup_skill(player_message)
+        if npc_response is not None:
+            if on_chunk is not None:
+                on_chunk(npc_response)
+        else:
+            # Generate AI prompt with character knowledge; the static
+            # profile block inside is cached on the agent, so only the
+            # mutable tail is rebuilt here
+            prompt = npc.get_dialogue_prompt(player_message, self.current_scene, character_knowledge)
+            
+            if self.verbose:
+                print(f"\n[Engine] Generating response for {npc.name}")
+                print(f"[Engine] Player said: {player_message}")
+            
+            # Get AI response, streaming chunks to the caller when requested
+            if on_chunk is not None and self.ai_provider.supports_streaming:
+                chunks = []
+                for chunk in self.ai_provider.stream_response(prompt):
+                    chunks.append(chunk)
+                    on_chunk(chunk)
+                npc_response = "".join(chunks).strip()
+            else:
+                npc_response = self.ai_provider.generate_response(prompt)
+            # Never compile provider error strings into skills: a transient
+            # failure would keep answering this question after recovery.
+            # Same guard the checkpoint cache applies before persisting.
+            if not _is_error_response(npc_response):
+                npc.observe_response(player_message, npc_response)
         
         if self.verbose:
             print(f"[Engine] {npc.name} responded: {npc_response}")
@@ -128,10 +241,7 @@ class DialogueEngine:
         npc.add_conversation_turn(npc.name, npc_response)
         
         # Fact-check the response if enabled
-        metadata = {
-            "npc_name": npc.name,
-            "validation_enabled": self.fact_checker is not None
-        }
+        metadata = dict(self._metadata_template, npc_name=npc.name)
         
         if self.fact_checker:
             # Check for potential deceptions
@@ -149,41 +259,43 @@ class DialogueEngine:
             
             # Track lies and omissions in NPC memory
             for result in validation_results:
+                claim_text = result.claim.claim_text
                 if result.is_lie:
                     npc.add_memory(
                         "lie",
-                        f"Lied: {result.claim['claim_text']}",
+                        f"Lied: {claim_text}",
                         {"player_message": player_message, "reason": result.reason}
                     )
                 elif result.is_omission:
                     npc.add_memory(
                         "omission",
-                        f"Omitted information related to: {result.claim['claim_text']}",
+                        f"Omitted information related to: {claim_text}",
                         {"player_message": player_message}
                     )
             
             metadata.update({
                 "is_valid": is_valid,
-                "validation_results": [
-                    {
-                        "claim": r.claim['claim_text'],
-                        "is_valid": r.is_valid,
-                        "is_lie": r.is_lie,
-                        "is_omission": r.is_omission,
-                        "reason": r.reason
-                    }
-                    for r in validation_results
-                ],
                 "likely_lies": likely_lies,
                 "likely_omissions": likely_omissions
             })
+            if self.collect_validation_results:
+                metadata["validation_results"] = [
+                    ValidationEntry(
+                        claim=r.claim.claim_text,
+                        is_valid=r.is_valid,
+                        is_lie=r.is_lie,
+                        is_omission=r.is_omission,
+                        reason=r.reason
+                    )
+                    for r in validation_results
+                ]
             
             if self.verbose and validation_results:
                 print(f"[Engine] Validation results:")
                 for result in validation_results:
                     status = "✓" if result.is_valid else "✗"
                     flag = " [LIE]" if result.is_lie else (" [OMISSION]" if result.is_omission else "")
-                    print(f"  {status} {result.claim['claim_text']}{flag}")
+                    print(f"  {status} {result.claim.claim_text}{flag}")
         
         return npc_response, metadata
     
@@ -194,37 +306,40 @@ class DialogueEngine:
             return []
         return npc.get_recent_conversation(num_turns)
     
+    @staticmethod
+    def _extend_memory_view(cache: Dict[str, Tuple[int, List[Dict[str, Any]]]],
+                            name: str, entries: List) -> List[Dict[str, Any]]:
+        """Serialize only the entries added since the cached view was built"""
+        cached_len, view = cache.get(name, (0, []))
+        if len(entries) != cached_len:
+            view.extend(
+                {
+                    "timestamp": entry.iso_timestamp,
+                    "content": entry.content,
+                    "context": entry.context
+                }
+                for entry in entries[cached_len:]
+            )
+            cache[name] = (len(entries), view)
+        return view
+
     def get_npc_lies(self, npc_name: str) -> List[Dict[str, Any]]:
         """Get all lies told by an NPC"""
         npc = self.get_npc(npc_name)
         if not npc:
             return []
-        return [
-            {
-                "timestamp": lie.timestamp,
-                "content": lie.content,
-                "context": lie.context
-            }
-            for lie in npc.lies_told
-        ]
-    
+        return self._extend_memory_view(self._lies_view_cache, npc.name, npc.lies_told)
+
     def get_npc_omissions(self, npc_name: str) -> List[Dict[str, Any]]:
         """Get all omissions made by an NPC"""
         npc = self.get_npc(npc_name)
         if not npc:
             return []
-        return [
-            {
-                "timestamp": omit.timestamp,
-                "content": omit.content,
-                "context": omit.context
-            }
-            for omit in npc.omissions_made
-        ]
+        return self._extend_memory_view(self._omissions_view_cache, npc.name, npc.omissions_made)
     
     def get_all_npcs(self) -> List[str]:
-        """Get names of all registered NPCs"""
-        return [npc.name for npc in self.npcs.values()]
+        """Get names of all registered NPCs (maintained sorted list)"""
+        return self._npc_names
     
     def get_npc_status(self, npc_name: str) -> Optional[Dict[str, Any]]:
         """Get current status of an NPC"""
@@ -237,7 +352,7 @@ class DialogueEngine:
             "location": npc.current_location,
             "emotional_state": npc.emotional_state,
             "conversation_turns": len(npc.conversation_history),
-            "memories": len(npc.memory),
+            "memories": npc.memory_count,
             "lies_told": len(npc.lies_told),
             "omissions_made": len(npc.omissions_made),
             "secrets": npc.secrets,
@@ -251,6 +366,7 @@ class DialogueEngine:
             return False
         
         npc.conversation_history = []
+        npc._recent_conversation.clear()
         if self.verbose:
             print(f"[Engine] Reset conversation with {npc.name}")
         return True
@@ -266,5 +382,9 @@ class DialogueEngine:
         
         if self.fact_checker:
             stats["fact_checking"] = self.fact_checker.get_validation_summary()
-        
+
+        response_cache = get_response_cache()
+        if response_cache.enabled:
+            stats["response_cache"] = response_cache.stats
+
         return stats
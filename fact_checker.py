@@ -5,20 +5,84 @@ Validates claims made by NPCs against the world state and tracks lies and omissi
 This ensures NPCs can't make up facts that contradict the established world.
 """
 
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional, Tuple
 from world_state import WorldState
 from npc_agent import NPCAgent
 import re
+import sys
 
+try:
+    import re2  # Optional: linear-time DFA engine (pyre2), drop-in for re
+except ImportError:
+    re2 = None
 
-class Claim(Dict):
+
+# Claim-extraction patterns, fused into one alternation compiled at import.
+# Each alternative has an outer group naming the claim kind and an inner
+# <kind>_val group capturing the claimed value, so one pass over the
+# statement replaces six separate scans:
+#   loc*:    "I was in the library", "I saw him in the garden"
+#   time*:   "at 9pm", "last night", "this morning"
+# Person mentions are handled separately by a character-name matcher built
+# from the actual roster (see FactChecker._get_name_matcher), which finds
+# multi-word names like "Nathan Cross" that a \w+ capture cannot.
+# All patterns are case-sensitive over lowercase literals; the extractor
+# lowers each statement once instead of paying per-character case folding
+# inside the engine.
+_CLAIM_PATTERNS = [
+    ("loc1", r"(?:i (?:was|am)|he (?:was|is)|she (?:was|is)|they (?:were|are)) (?:in|at) (?:the )?(?P<loc1_val>\w+)"),
+    ("loc2", r"(?:saw|found|met) (?:\w+ )?(?:in|at) (?:the )?(?P<loc2_val>\w+)"),
+    ("time1", r"at (?P<time1_val>\d{1,2}(?::\d{2})?\s*(?:am|pm))"),
+    ("time2", r"(?P<time2_val>last night|this morning|yesterday|tonight)"),
+]
+
+def _compile_claim_pattern():
+    """
+    Compile the fused alternation, preferring re2's linear-time DFA when
+    pyre2 is installed. A probe match verifies the wrapper preserves the
+    named-group semantics the extractor depends on (lastgroup dispatch and
+    <kind>_val capture); any mismatch falls back to the stdlib engine.
+    """
+    source = "|".join(f"(?P<{name}>{pattern})" for name, pattern in _CLAIM_PATTERNS)
+    if re2 is not None:
+        try:
+            pattern = re2.compile(source)
+            probe = pattern.search("i was in the library")
+            if (probe is not None and probe.lastgroup == "loc1"
+                    and probe.group("loc1_val") == "library"):
+                return pattern
+        except Exception:
+            pass
+    return re.compile(source)
+
+
+_CLAIM_RE = _compile_claim_pattern()
+
+# claim kind -> (category, claim key)
+_CLAIM_KINDS = {
+    "loc1": ("location", "mentioned_location"),
+    "loc2": ("location", "mentioned_location"),
+    "time1": ("time", "mentioned_time"),
+    "time2": ("time", "mentioned_time"),
+}
+
+
+
+@dataclass(frozen=True, slots=True)
+class Claim:
     """Represents a factual claim extracted from dialogue"""
-    def __init__(self, claim_text: str, category: str, key: str, value: Any):
-        super().__init__()
-        self['claim_text'] = claim_text
-        self['category'] = category
-        self['key'] = key
-        self['value'] = value
+    claim_text: str
+    category: str
+    key: str
+    value: Any
+
+    def __post_init__(self) -> None:
+        # category/key come from a small fixed vocabulary; interning them
+        # makes the dispatch comparisons pointer checks
+        object.__setattr__(self, "category", sys.intern(self.category))
+        object.__setattr__(self, "key", sys.intern(self.key))
 
 
 class ValidationResult:
@@ -31,7 +95,7 @@ class ValidationResult:
         world_truth: Optional[Any] = None,
         is_lie: bool = False,
         is_omission: bool = False
-    ):
+    ) -> None:
         self.is_valid = is_valid
         self.claim = claim
         self.reason = reason
@@ -41,7 +105,7 @@ class ValidationResult:
     
     def __repr__(self) -> str:
         status = "VALID" if self.is_valid else ("LIE" if self.is_lie else "INVALID")
-        return f"ValidationResult({status}: {self.claim['claim_text']})"
+        return f"ValidationResult({status}: {self.claim.claim_text})"
 
 
 class FactChecker:
@@ -50,9 +114,60 @@ class FactChecker:
     Tracks intentional lies and omissions.
     """
     
-    def __init__(self, world_state: WorldState):
+    def __init__(self, world_state: WorldState) -> None:
         self.world_state = world_state
-        self.validation_history: List[ValidationResult] = []
+        # Bounded: long console sessions otherwise grow the history without
+        # limit; the summary counters below track all-time totals
+        self.validation_history: "deque[ValidationResult]" = deque(maxlen=10000)
+
+        # Compiled multi-name matcher over the character roster, rebuilt
+        # only when the roster grows
+        self._name_matcher = None
+        self._name_matcher_size = -1
+
+        # Category -> checker dispatch for validate_claim; fact-key lookup
+        # is the default for everything else
+        self._claim_checks = {
+            "location": self._check_location,
+            "person": self._check_person,
+        }
+
+        # Bounded LRU memo of extracted claims: playtests repeat the same
+        # short formulaic statements, so hits skip the regex work entirely.
+        # Keyed on (statement, roster size) since person claims depend on
+        # the roster. Claim is frozen, so cached tuples are safe to share.
+        self._extract_cache: "OrderedDict[Tuple[str, int], Tuple[Claim, ...]]" = OrderedDict()
+        self._extract_cache_max = 4096
+
+        # Running totals maintained at append time so get_validation_summary
+        # never rescans the history
+        self._n_results = 0
+        self._n_valid = 0
+        self._n_lies = 0
+        self._n_omissions = 0
+
+    def _get_name_matcher(self) -> Optional[Tuple["re.Pattern[str]", Dict[str, str]]]:
+        """
+        One linear-scan matcher for every known character name.
+
+        A longest-first alternation over the actual roster stands in for an
+        Aho-Corasick automaton (no extra dependency needed at this scale):
+        it finds all occurrences, including multi-word names, in a single
+        pass, and maps each lowercased hit back to the canonical name.
+        """
+        characters = self.world_state.characters
+        if self._name_matcher_size != len(characters):
+            if characters:
+                names = sorted(characters, key=len, reverse=True)
+                pattern = re.compile(
+                    "|".join(re.escape(name.lower()) for name in names)
+                )
+                canonical = {name.lower(): name for name in names}
+                self._name_matcher = (pattern, canonical)
+            else:
+                self._name_matcher = None
+            self._name_matcher_size = len(characters)
+        return self._name_matcher
     
     def extract_claims_from_statement(self, statement: str) -> List[Claim]:
         """
@@ -60,62 +175,44 @@ class FactChecker:
         In a full implementation, this would use AI to parse natural language.
         For now, we'll use pattern matching and simple heuristics.
         """
-        claims = []
+        cache_key = (statement, len(self.world_state.characters))
+        cached = self._extract_cache.get(cache_key)
+        if cached is not None:
+            self._extract_cache.move_to_end(cache_key)
+            return list(cached)
         
-        # Pattern matching for common claim types
-        # Location claims: "I was in the library", "I saw him in the garden"
-        location_patterns = [
-            r"(?:I (?:was|am)|he (?:was|is)|she (?:was|is)|they (?:were|are)) (?:in|at) (?:the )?(\w+)",
-            r"(?:saw|found|met) (?:\w+ )?(?:in|at) (?:the )?(\w+)",
-        ]
-        
-        for pattern in location_patterns:
-            matches = re.finditer(pattern, statement, re.IGNORECASE)
-            for match in matches:
-                location = match.group(1)
-                claims.append(Claim(
-                    claim_text=match.group(0),
-                    category="location",
-                    key=f"mentioned_location",
-                    value=location
-                ))
+        claims = []
+        # One lower() per statement; claim_text slices the original so
+        # surface casing survives for marked-lie matching and display
+        lowered = statement.lower()
         
-        # Time claims: "at 9pm", "last night", "this morning"
-        time_patterns = [
-            r"at (\d{1,2}(?::\d{2})?\s*(?:am|pm))",
-            r"(last night|this morning|yesterday|tonight)",
-        ]
+        for match in _CLAIM_RE.finditer(lowered):
+            kind = match.lastgroup
+            category, key = _CLAIM_KINDS[kind]
+            start, end = match.span()
+            claims.append(Claim(
+                claim_text=statement[start:end],
+                category=category,
+                key=key,
+                value=match.group(kind + "_val")
+            ))
         
-        for pattern in time_patterns:
-            matches = re.finditer(pattern, statement, re.IGNORECASE)
-            for match in matches:
-                time_ref = match.group(1)
+        # Person mentions: one roster-wide scan, multi-word names included
+        matcher = self._get_name_matcher()
+        if matcher is not None:
+            pattern, canonical = matcher
+            for match in pattern.finditer(lowered):
+                start, end = match.span()
                 claims.append(Claim(
-                    claim_text=match.group(0),
-                    category="time",
-                    key=f"mentioned_time",
-                    value=time_ref
+                    claim_text=statement[start:end],
+                    category="person",
+                    key="mentioned_person",
+                    value=canonical[match.group(0)]
                 ))
         
-        # Person mentions: "I saw John", "spoke with Mary"
-        person_patterns = [
-            r"(?:saw|met|spoke with|talked to) (\w+)",
-            r"(\w+) (?:was|is) (?:there|here|present)",
-        ]
-        
-        for pattern in person_patterns:
-            matches = re.finditer(pattern, statement, re.IGNORECASE)
-            for match in matches:
-                person = match.group(1)
-                # Only track if it's a known character
-                if person in self.world_state.characters:
-                    claims.append(Claim(
-                        claim_text=match.group(0),
-                        category="person",
-                        key=f"mentioned_person",
-                        value=person
-                    ))
-        
+        self._extract_cache[cache_key] = tuple(claims)
+        if len(self._extract_cache) > self._extract_cache_max:
+            self._extract_cache.popitem(last=False)
         return claims
     
     def validate_claim(
@@ -153,76 +250,83 @@ class FactChecker:
             )
             return result
         
-        # Check if the claim matches world state
-        category = claim['category']
-        key = claim['key']
-        claimed_value = claim['value']
-        
-        # For location claims, verify the location exists
-        if category == "location":
-            if claimed_value.lower() in [loc.lower() for loc in self.world_state.locations]:
-                result = ValidationResult(
-                    is_valid=True,
-                    claim=claim,
-                    reason="Location exists in world",
-                    world_truth=claimed_value
-                )
-            else:
-                result = ValidationResult(
-                    is_valid=False,
-                    claim=claim,
-                    reason=f"Location '{claimed_value}' does not exist in world state",
-                    world_truth=None
-                )
-        
-        # For person mentions, verify the person exists
-        elif category == "person":
-            if claimed_value in self.world_state.characters:
-                result = ValidationResult(
-                    is_valid=True,
-                    claim=claim,
-                    reason="Character exists in world",
-                    world_truth=claimed_value
-                )
-            else:
-                result = ValidationResult(
-                    is_valid=False,
-                    claim=claim,
-                    reason=f"Character '{claimed_value}' does not exist in world state",
-                    world_truth=None
-                )
-        
-        # For specific fact keys, check against world state
-        elif key in self.world_state.facts:
+        # Check if the claim matches world state; O(1) category dispatch
+        # instead of an elif chain (categories are interned at construction)
+        check = self._claim_checks.get(claim.category, self._check_fact)
+        result = check(claim)
+
+        if result.is_valid:
+            self._n_valid += 1
+        if result.is_lie:
+            self._n_lies += 1
+        if result.is_omission:
+            self._n_omissions += 1
+        self._n_results += 1
+        self.validation_history.append(result)
+        return result
+
+    def _check_location(self, claim: Claim) -> ValidationResult:
+        """Verify a claimed location exists in the world"""
+        claimed_value = claim.value
+        if claimed_value.lower() in self.world_state._locations_lower:
+            return ValidationResult(
+                is_valid=True,
+                claim=claim,
+                reason="Location exists in world",
+                world_truth=claimed_value
+            )
+        return ValidationResult(
+            is_valid=False,
+            claim=claim,
+            reason=f"Location '{claimed_value}' does not exist in world state",
+            world_truth=None
+        )
+
+    def _check_person(self, claim: Claim) -> ValidationResult:
+        """Verify a mentioned person exists in the world"""
+        claimed_value = claim.value
+        if claimed_value in self.world_state.characters:
+            return ValidationResult(
+                is_valid=True,
+                claim=claim,
+                reason="Character exists in world",
+                world_truth=claimed_value
+            )
+        return ValidationResult(
+            is_valid=False,
+            claim=claim,
+            reason=f"Character '{claimed_value}' does not exist in world state",
+            world_truth=None
+        )
+
+    def _check_fact(self, claim: Claim) -> ValidationResult:
+        """Check a claim against a known fact key, allowing new information"""
+        key = claim.key
+        claimed_value = claim.value
+        if key in self.world_state.facts:
             world_value = self.world_state.get_fact(key)
-            if str(world_value).lower() == str(claimed_value).lower():
-                result = ValidationResult(
+            if self.world_state._facts_lower[key] == str(claimed_value).lower():
+                return ValidationResult(
                     is_valid=True,
                     claim=claim,
                     reason="Matches world state fact",
                     world_truth=world_value
                 )
-            else:
-                result = ValidationResult(
-                    is_valid=False,
-                    claim=claim,
-                    reason=f"Contradicts world state. Truth: {world_value}",
-                    world_truth=world_value,
-                    is_lie=True  # Unintentional lie / error
-                )
-        
-        # Unknown claims are allowed (new information)
-        else:
-            result = ValidationResult(
-                is_valid=True,
+            return ValidationResult(
+                is_valid=False,
                 claim=claim,
-                reason="No contradiction with known facts",
-                world_truth=None
+                reason=f"Contradicts world state. Truth: {world_value}",
+                world_truth=world_value,
+                is_lie=True  # Unintentional lie / error
             )
-        
-        self.validation_history.append(result)
-        return result
-    
+        # Unknown claims are allowed (new information)
+        return ValidationResult(
+            is_valid=True,
+            claim=claim,
+            reason="No contradiction with known facts",
+            world_truth=None
+        )
+
     def validate_statement(
         self,
         statement: str,
@@ -242,19 +346,22 @@ class FactChecker:
         Returns:
             Tuple of (is_valid, list of validation results)
         """
-        marked_lies = marked_lies or []
-        marked_omissions = marked_omissions or []
-        
         # Extract claims
         claims = self.extract_claims_from_statement(statement)
-        
+        if not claims:
+            # Short acknowledgements ("Yes.", "I see.") carry nothing to check
+            return True, []
+
+        marked_lies = marked_lies or []
+        marked_omissions = marked_omissions or []
+
         # Validate each claim
         results = []
         all_valid = True
         
         for claim in claims:
-            is_lie = claim['claim_text'] in marked_lies
-            is_omission = claim['claim_text'] in marked_omissions
+            is_lie = claim.claim_text in marked_lies
+            is_omission = claim.claim_text in marked_omissions
             
             result = self.validate_claim(claim, character, is_lie, is_omission)
             results.append(result)
@@ -264,6 +371,65 @@ class FactChecker:
         
         return all_valid, results
     
+    def validate_statements(
+        self,
+        statements: List[str],
+        character: NPCAgent
+    ) -> List[Tuple[bool, List[ValidationResult]]]:
+        """
+        Validate a batch of statements from the same NPC (scenario replay).
+
+        Extraction for the whole batch is done up front so the location
+        claims can be checked against the world in a single set
+        intersection instead of one membership probe per claim; claims
+        that need per-claim context (people, fact keys) still go through
+        validate_claim. Results line up with the input statements.
+        """
+        batch_claims = [self.extract_claims_from_statement(s) for s in statements]
+
+        # One pass over the whole batch: any claimed location outside this
+        # set is invalid, everything else follows the normal claim path
+        claimed_locs = {
+            claim.value.lower()
+            for claims in batch_claims
+            for claim in claims
+            if claim.category == "location"
+        }
+        known_locs = claimed_locs & self.world_state._locations_lower
+
+        out = []
+        for claims in batch_claims:
+            results = []
+            all_valid = True
+            for claim in claims:
+                if claim.category == "location":
+                    if claim.value.lower() in known_locs:
+                        result = ValidationResult(
+                            is_valid=True,
+                            claim=claim,
+                            reason="Location exists in world",
+                            world_truth=claim.value
+                        )
+                    else:
+                        result = ValidationResult(
+                            is_valid=False,
+                            claim=claim,
+                            reason=f"Location '{claim.value}' does not exist in world state",
+                            world_truth=None
+                        )
+                        all_valid = False
+                    if result.is_valid:
+                        self._n_valid += 1
+                    self._n_results += 1
+                    self.validation_history.append(result)
+                else:
+                    result = self.validate_claim(claim, character)
+                    if not result.is_valid and not result.is_lie:
+                        all_valid = False
+                results.append(result)
+            out.append((all_valid, results))
+        return out
+
     def check_knowledge_consistency(self, character: NPCAgent, fact_key: str) -> bool:
         """
         Check if a character should know a particular fact based on world state.
@@ -271,18 +437,16 @@ class FactChecker:
         return self.world_state.character_knows_fact(character.name, fact_key)
     
     def get_validation_summary(self) -> Dict[str, Any]:
-        """Get a summary of all validations performed"""
-        total = len(self.validation_history)
-        valid = len([r for r in self.validation_history if r.is_valid])
-        lies = len([r for r in self.validation_history if r.is_lie])
-        omissions = len([r for r in self.validation_history if r.is_omission])
+        """Get a summary of all validations performed (O(1) counters)"""
+        total = self._n_results
+        valid = self._n_valid
         
         return {
             "total_validations": total,
             "valid_claims": valid,
             "invalid_claims": total - valid,
-            "intentional_lies": lies,
-            "omissions": omissions,
+            "intentional_lies": self._n_lies,
+            "omissions": self._n_omissions,
             "accuracy_rate": (valid / total * 100) if total > 0 else 0
         }
 
@@ -313,16 +477,29 @@ class IntentionAnalyzer:
         
         likely_lies = []
         likely_omissions = []
-        
+
+        # Secrets never change after construction; invert them once per
+        # character into word -> secret indices so each statement costs one
+        # dict probe per token instead of an intersection per secret
+        secret_index = getattr(character, "_secret_word_index", None)
+        if secret_index is None:
+            secret_index = {}
+            for i, secret in enumerate(character.secrets):
+                for word in set(secret.lower().split()):
+                    secret_index.setdefault(word, []).append(i)
+            character._secret_word_index = secret_index
+
         # Simple heuristic: check if character has secrets they might be hiding
-        for secret in character.secrets:
-            # If the secret is related to the statement topic, flag potential omission
-            secret_words = set(secret.lower().split())
-            statement_words = set(statement.lower().split())
-            
-            if len(secret_words & statement_words) > 0:
-                # Character is talking about something related to their secret
-                # Might be an omission
-                likely_omissions.append(f"Potential omission related to: {secret}")
-        
+        matched = set()
+        for word in set(statement.lower().split()):
+            hits = secret_index.get(word)
+            if hits:
+                matched.update(hits)
+
+        # Character is talking about something related to these secrets —
+        # might be omissions
+        secrets = character.secrets
+        for i in sorted(matched):
+            likely_omissions.append(f"Potential omission related to: {secrets[i]}")
+
         return likely_lies, likely_omissions
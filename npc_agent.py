@@ -6,21 +6,73 @@ The agent uses AI to generate contextually appropriate dialogue while maintainin
 consistency with the world state.
 """
 
-from typing import Dict, List, Any, Optional
-from pydantic import BaseModel, Field
+import copyreg
+import json
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional
 from datetime import datetime
+from types import MappingProxyType
 
 
-class MemoryEntry(BaseModel):
+# Newline for use inside f-string expressions (backslashes are not
+# allowed there on this interpreter)
+_NL = "\n"
+
+# A response repeated this many times for the same normalized question and
+# emotional state gets promoted to a deterministic skill (no AI call)
+_SKILL_PROMOTE_AFTER = 3
+
+# Shared immutable context payloads: most memories carry no context, and
+# conversation memories carry the same tiny {"speaker": name} mapping over
+# and over — one read-only object per shape instead of a dict per entry
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+_SPEAKER_CONTEXTS: Dict[str, Mapping[str, Any]] = {}
+
+
+def _speaker_context(speaker: str) -> Mapping[str, Any]:
+    context = _SPEAKER_CONTEXTS.get(speaker)
+    if context is None:
+        context = _SPEAKER_CONTEXTS[speaker] = MappingProxyType({"speaker": speaker})
+    return context
+
+
+def _rebuild_mappingproxy(mapping):
+    return MappingProxyType(mapping)
+
+
+def _pickle_mappingproxy(proxy):
+    return _rebuild_mappingproxy, (dict(proxy),)
+
+
+# Shared contexts must survive pickle/deepcopy of agents
+copyreg.pickle(type(MappingProxyType({})), _pickle_mappingproxy)
+
+
+# Slotted dataclasses: memories are created on every dialogue turn, so
+# they skip pydantic's validation machinery and per-instance __dict__
+
+@dataclass(slots=True)
+class MemoryEntry:
     """Represents a memory in the NPC's mind"""
-    timestamp: str
+    timestamp: float  # epoch seconds; formatted lazily via iso_timestamp
     type: str  # "conversation", "observation", "lie", "omission", "event"
     content: str
-    context: Dict[str, Any] = Field(default_factory=dict)
+    # default_factory returning the shared proxy: dataclasses refuse a bare
+    # mappingproxy default, but the factory hands back the same object
+    context: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_CONTEXT)
     emotional_impact: int = 0  # -10 to +10
 
+    @property
+    def iso_timestamp(self) -> str:
+        """ISO-8601 rendering, computed only when something serializes it"""
+        return datetime.fromtimestamp(self.timestamp).isoformat()
 
-class CharacterTrait(BaseModel):
+
+@dataclass(slots=True)
+class CharacterTrait:
     """Represents a personality trait or characteristic"""
     name: str
     description: str
@@ -32,7 +84,23 @@ class NPCAgent:
     An AI-powered NPC agent that can engage in dialogue while maintaining
     character consistency and tracking its own lies and omissions.
     """
-    
+
+    # One agent per character per game, but attribute access is constant in
+    # every hot path; slots take the C descriptor path and drop the
+    # per-instance __dict__. _secret_word_index is assigned lazily by
+    # IntentionAnalyzer and must stay declared here.
+    __slots__ = (
+        "name", "personality", "background", "goals", "fears", "secrets",
+        "traits", "relationships", "current_location", "emotional_state",
+        "memory", "conversation_history", "lies_told", "omissions_made",
+        "_recent_memories", "_recent_lies", "_recent_omissions",
+        "_recent_conversation", "memory_count", "_memory_log",
+        "known_facts", "witnessed_events", "_state_version",
+        "_context_cache", "_context_cache_version",
+        "_skill_cache", "_skill_candidates", "_static_prompt_block",
+        "_secret_word_index",
+    )
+
     def __init__(
         self,
         name: str,
@@ -44,7 +112,8 @@ class NPCAgent:
         traits: Optional[List[CharacterTrait]] = None,
         relationships: Optional[Dict[str, str]] = None,
         current_location: str = "unknown",
-        emotional_state: str = "neutral"
+        emotional_state: str = "neutral",
+        memory_log_path: Optional[str] = None
     ):
         self.name = name
         self.personality = personality
@@ -57,57 +126,117 @@ class NPCAgent:
         self.current_location = current_location
         self.emotional_state = emotional_state
         
-        # Memory systems
+        # Memory systems: full append-only logs plus bounded trailing
+        # windows sized for the context/prompt builders, so no caller ever
+        # slices the tail off a long list
         self.memory: List[MemoryEntry] = []
         self.conversation_history: List[Dict[str, str]] = []
         self.lies_told: List[MemoryEntry] = []
         self.omissions_made: List[MemoryEntry] = []
+        self._recent_memories: "deque[MemoryEntry]" = deque(maxlen=20)
+        self._recent_lies: "deque[MemoryEntry]" = deque(maxlen=5)
+        self._recent_omissions: "deque[MemoryEntry]" = deque(maxlen=5)
+        self._recent_conversation: "deque[Dict[str, str]]" = deque(maxlen=10)
+
+        # Optional cold storage: with a log path, full memories stream to an
+        # append-only jsonl file and only the trailing windows stay in RAM,
+        # keeping long sessions at constant memory. memory_count always
+        # reflects the all-time total either way.
+        self.memory_count = 0
+        self._memory_log = open(memory_log_path, "a", encoding="utf-8") if memory_log_path else None
         
-        # Knowledge base
+        # Knowledge base. witnessed_events is a dict used as an ordered set:
+        # O(1) membership with insertion order preserved for iteration
         self.known_facts: Dict[str, Any] = {}
-        self.witnessed_events: List[str] = []
+        self.witnessed_events: Dict[str, None] = {}
+
+        # Bumped on every state mutation; callers can key caches (e.g. the
+        # engine's prompt memo) on this to detect staleness cheaply
+        self._state_version = 0
+
+        # Memoized get_character_context output, keyed on the version above;
+        # most turns change nothing, so the rebuild is skipped entirely
+        self._context_cache: Optional[Dict[str, Any]] = None
+        self._context_cache_version = -1
+
+        # Compiled "skills": repeated questions that keep drawing the same
+        # answer are served deterministically, skipping prompt assembly and
+        # the provider round-trip. Candidates count identical repeats until
+        # promotion; anything that changes what the agent knows clears both.
+        self._skill_cache: Dict[Any, str] = {}
+        self._skill_candidates: Dict[Any, List[Any]] = {}
+
+        # Goals/fears/secrets/relationships are fixed at construction, so
+        # their prompt sections are rendered once on first use; anything
+        # that ever mutates them must reset this to None
+        self._static_prompt_block: Optional[str] = None
         
     def add_memory(self, memory_type: str, content: str, 
-                   context: Optional[Dict[str, Any]] = None,
+                   context: Optional[Mapping[str, Any]] = None,
                    emotional_impact: int = 0) -> None:
         """Add a memory entry"""
         memory = MemoryEntry(
-            timestamp=datetime.now().isoformat(),
+            timestamp=time.time(),
             type=memory_type,
             content=content,
-            context=context or {},
+            context=context if context is not None else _EMPTY_CONTEXT,
             emotional_impact=emotional_impact
         )
-        self.memory.append(memory)
-        
+        if self._memory_log is not None:
+            self._memory_log.write(json.dumps({
+                "timestamp": memory.timestamp,
+                "type": memory.type,
+                "content": memory.content,
+                "context": dict(memory.context),
+                "emotional_impact": memory.emotional_impact
+            }) + "\n")
+        else:
+            self.memory.append(memory)
+        self.memory_count += 1
+        self._recent_memories.append(memory)
+        self._state_version += 1
+
         # Track lies and omissions separately for easy reference
         if memory_type == "lie":
             self.lies_told.append(memory)
+            self._recent_lies.append(memory)
         elif memory_type == "omission":
             self.omissions_made.append(memory)
+            self._recent_omissions.append(memory)
     
     def add_conversation_turn(self, speaker: str, message: str) -> None:
         """Record a turn in the conversation"""
-        self.conversation_history.append({
-            "timestamp": datetime.now().isoformat(),
-            "speaker": speaker,
+        turn = {
+            "timestamp": time.time(),
+            # Interned: one of two values repeated per transcript, and the
+            # display loop's speaker comparison hits pointer identity first
+            "speaker": sys.intern(speaker),
             "message": message
-        })
+        }
+        self.conversation_history.append(turn)
+        self._recent_conversation.append(turn)
         
         # Also add to general memory
         self.add_memory(
             "conversation",
             f"{speaker}: {message}",
-            {"speaker": speaker}
+            _speaker_context(speaker)
         )
     
     def get_recent_conversation(self, num_turns: int = 10) -> List[Dict[str, str]]:
         """Get the most recent conversation turns"""
+        window = self._recent_conversation
+        if num_turns <= window.maxlen:
+            turns = list(window)
+            return turns[-num_turns:] if num_turns < len(turns) else turns
         return self.conversation_history[-num_turns:]
     
     def add_known_fact(self, key: str, value: Any) -> None:
         """Add a fact to the character's knowledge base"""
-        self.known_facts[key] = value
+        if self.known_facts.get(key) != value:
+            self.known_facts[key] = value
+            self._state_version += 1
+            self.invalidate_skills()
     
     def knows_fact(self, key: str) -> bool:
         """Check if the character knows a particular fact"""
@@ -116,14 +245,46 @@ class NPCAgent:
     def add_witnessed_event(self, event_id: str) -> None:
         """Record that the character witnessed an event"""
         if event_id not in self.witnessed_events:
-            self.witnessed_events.append(event_id)
+            self.witnessed_events[event_id] = None
+            self._state_version += 1
+            self.invalidate_skills()
+
+    def _skill_key(self, player_message: str):
+        """Normalized question plus mood: the context a canned reply is tied to"""
+        return (" ".join(player_message.lower().split()), self.emotional_state)
+
+    def lookup_skill(self, player_message: str) -> Optional[str]:
+        """Deterministic reply for a question this agent has settled on, if any"""
+        if not self._skill_cache:
+            return None
+        return self._skill_cache.get(self._skill_key(player_message))
+
+    def observe_response(self, player_message: str, response: str) -> None:
+        """Count identical replies per question; promote stable ones to skills"""
+        key = self._skill_key(player_message)
+        candidate = self._skill_candidates.get(key)
+        if candidate is not None and candidate[0] == response:
+            candidate[1] += 1
+            if candidate[1] >= _SKILL_PROMOTE_AFTER:
+                self._skill_cache[key] = response
+                del self._skill_candidates[key]
+        else:
+            self._skill_candidates[key] = [response, 1]
+
+    def invalidate_skills(self) -> None:
+        """Drop compiled replies; what the agent knows has changed"""
+        self._skill_cache.clear()
+        self._skill_candidates.clear()
     
     def get_character_context(self) -> Dict[str, Any]:
         """
         Generate a complete context dictionary for this character.
         This is used to provide the AI with all necessary information.
+        The result is cached until the next state mutation.
         """
-        return {
+        if self._context_cache_version == self._state_version:
+            return self._context_cache
+        context = {
             "name": self.name,
             "personality": self.personality,
             "background": self.background,
@@ -137,7 +298,7 @@ class NPCAgent:
             "known_facts": self.known_facts,
             "recent_memories": [
                 {"type": m.type, "content": m.content}
-                for m in self.memory[-20:]  # Last 20 memories
+                for m in self._recent_memories  # Last 20 memories
             ],
             "lies_told": [
                 {"content": lie.content, "context": lie.context}
@@ -148,6 +309,9 @@ class NPCAgent:
                 for omit in self.omissions_made
             ]
         }
+        self._context_cache = context
+        self._context_cache_version = self._state_version
+        return context
     
     def get_dialogue_prompt(self, player_message: str, 
                            scene_description: str = "",
@@ -161,53 +325,63 @@ class NPCAgent:
             scene_description: Current scene context
             character_knowledge: Optional knowledge export from world state (includes schedule)
         """
-        context = self.get_character_context()
-        recent_conv = self.get_recent_conversation()
+        recent_conv = self.get_recent_conversation(5)
         
         # Build schedule section if available
         schedule_text = ""
         if character_knowledge and "schedule" in character_knowledge:
             schedule_entries = character_knowledge["schedule"]
             if schedule_entries:
-                schedule_text = "\n\nYOUR SCHEDULE (where you were and what you were doing):\n"
+                parts = ["\n\nYOUR SCHEDULE (where you were and what you were doing):"]
                 for entry in schedule_entries:
-                    schedule_text += f"- {entry['time']}: {entry['location']} - {entry['activity']}"
+                    line = f"- {entry['time']}: {entry['location']} - {entry['activity']}"
                     if entry['with']:
-                        schedule_text += f" (with {', '.join(entry['with'])})"
-                    schedule_text += "\n"
-                schedule_text += "\nIMPORTANT: Only claim to be in locations listed in your schedule. Be specific about times when asked."
+                        line += f" (with {', '.join(entry['with'])})"
+                    parts.append(line)
+                parts.append("\nIMPORTANT: Only claim to be in locations listed in your schedule. Be specific about times when asked.")
+                schedule_text = "\n".join(parts)
         
-        prompt = f"""You are {self.name}, an NPC in a murder mystery game set in Victorian England (1800s).
+        # Static prefix rendered once and kept byte-identical across turns:
+        # provider-side prompt caches reuse the longest common prefix, so
+        # everything that never changes (identity, profile, goals, fears,
+        # secrets, relationships) comes first and mutable state trails it.
+        # Relationships are sorted so dict order can never perturb the bytes.
+        if self._static_prompt_block is None:
+            self._static_prompt_block = f"""You are {self.name}, an NPC in a murder mystery game set in Victorian England (1800s).
 
 CHARACTER PROFILE:
 - Personality: {self.personality}
 - Background: {self.background}
-- Current Location: {self.current_location}
-- Emotional State: {self.emotional_state}
 
 GOALS:
-{chr(10).join(f"- {goal}" for goal in self.goals)}
+{_NL.join([f"- {goal}" for goal in self.goals])}
 
 FEARS:
-{chr(10).join(f"- {fear}" for fear in self.fears)}
+{_NL.join([f"- {fear}" for fear in self.fears])}
 
 SECRETS (things you want to hide):
-{chr(10).join(f"- {secret}" for secret in self.secrets)}
+{_NL.join([f"- {secret}" for secret in self.secrets])}
 
 RELATIONSHIPS:
-{chr(10).join(f"- {char}: {desc}" for char, desc in self.relationships.items())}
+{_NL.join([f"- {char}: {desc}" for char, desc in sorted(self.relationships.items())])}"""
+
+        prompt = f"""{self._static_prompt_block}
 
 WHAT YOU KNOW (facts you're aware of):
-{chr(10).join(f"- {key}: {value}" for key, value in self.known_facts.items())}{schedule_text}
+{_NL.join([f"- {key}: {value}" for key, value in sorted(self.known_facts.items())])}{schedule_text}
+
+CURRENT STATE:
+- Current Location: {self.current_location}
+- Emotional State: {self.emotional_state}
 
 LIES YOU'VE TOLD RECENTLY:
-{chr(10).join(f"- {lie.content}" for lie in self.lies_told[-5:])}
+{_NL.join([f"- {lie.content}" for lie in self._recent_lies])}
 
 THINGS YOU'VE DELIBERATELY OMITTED:
-{chr(10).join(f"- {omit.content}" for omit in self.omissions_made[-5:])}
+{_NL.join([f"- {omit.content}" for omit in self._recent_omissions])}
 
 RECENT CONVERSATION:
-{chr(10).join(f"{turn['speaker']}: {turn['message']}" for turn in recent_conv[-5:])}
+{_NL.join([f"{turn['speaker']}: {turn['message']}" for turn in recent_conv])}
 
 CURRENT SCENE:
 {scene_description if scene_description else "No specific scene details."}
@@ -266,5 +440,17 @@ Claims:"""
             {"from": old_location, "to": location}
         )
     
+    def close_memory_log(self) -> None:
+        """Flush and close the append-only memory log, if one is open"""
+        if self._memory_log is not None:
+            self._memory_log.close()
+            self._memory_log = None
+
+    @staticmethod
+    def replay_memory_log(path: str) -> List[MemoryEntry]:
+        """Load memories back from a jsonl log for postmortem inspection"""
+        with open(path, encoding="utf-8") as handle:
+            return [MemoryEntry(**json.loads(line)) for line in handle if line.strip()]
+
     def __repr__(self) -> str:
         return f"NPCAgent(name='{self.name}', location='{self.current_location}')"
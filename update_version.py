@@ -17,11 +17,18 @@ from datetime import date
 from pathlib import Path
 
 
+# Compiled once at import so repeated invocations (CI loops, tests) skip
+# per-call pattern compilation; ASCII since version strings never need
+# Unicode-aware character classes
+_VERSION_RE = re.compile(r'__version__\s*=\s*"([^"]+)"', re.ASCII)
+_README_VERSION_RE = re.compile(r'\*\*Version \d+\.\d+\.\d+\*\*', re.ASCII)
+
+
 def get_current_version():
     """Read current version from version.py"""
     version_file = Path("version.py")
     content = version_file.read_text()
-    match = re.search(r'__version__\s*=\s*"([^"]+)"', content)
+    match = _VERSION_RE.search(content)
     if match:
         return match.group(1)
     raise ValueError("Could not find version in version.py")
@@ -54,24 +61,20 @@ def update_version_file(new_version, message=""):
     version_file = Path("version.py")
     content = version_file.read_text()
     
-    # Update version string
-    content = re.sub(
-        r'__version__\s*=\s*"[^"]+"',
-        f'__version__ = "{new_version}"',
-        content
-    )
+    # Update version string: locate the old assignment once, then replace
+    # the literal — no regex reparse of the whole file
+    match = _VERSION_RE.search(content)
+    if match:
+        content = content.replace(match.group(0), f'__version__ = "{new_version}"', 1)
     
     # Add to version history if message provided
     if message:
         today = date.today().strftime("%Y-%m-%d")
         history_entry = f"{new_version} ({today})\n{'-' * (len(new_version) + 12)}\n- {message}\n\n"
         
-        # Insert after VERSION_HISTORY = """
-        content = re.sub(
-            r'(VERSION_HISTORY\s*=\s*""")\n',
-            f'\\1\n{history_entry}',
-            content
-        )
+        # Insert after VERSION_HISTORY = """ (unique literal marker)
+        marker = 'VERSION_HISTORY = """\n'
+        content = content.replace(marker, marker + history_entry, 1)
     
     version_file.write_text(content)
     print(f"✓ Updated version.py to {new_version}")
@@ -83,11 +86,7 @@ def update_readme(new_version):
     content = readme_file.read_text()
     
     # Update version badge/header
-    content = re.sub(
-        r'\*\*Version \d+\.\d+\.\d+\*\*',
-        f'**Version {new_version}**',
-        content
-    )
+    content = _README_VERSION_RE.sub(f'**Version {new_version}**', content)
     
     readme_file.write_text(content)
     print(f"✓ Updated README.md to {new_version}")
@@ -5,12 +5,42 @@ Manages all facts, locations, events, relationships, and timeline in the game wo
 NPCs can query this to verify their claims and maintain consistency.
 """
 
-from typing import Dict, List, Any, Optional, Set
+import os
+import sys
+from bisect import insort
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict, FrozenSet, List, Any, NamedTuple, Optional, Sequence, Set, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field
 
 
-class Fact(BaseModel):
+# Canonical time-period ordering, shared by every WorldState instance.
+# The frozenset backs O(1) validation; the index map backs chronological
+# sorting without list scans.
+TIME_PERIODS = ("early_morning", "morning", "noon", "afternoon", "early_evening", "evening", "night", "late_night", "overnight")
+TIME_PERIODS_SET = frozenset(TIME_PERIODS)
+PERIOD_INDEX = {p: i for i, p in enumerate(TIME_PERIODS)}
+
+
+# Hash-consed witness sets: identical witness groups recur across many
+# facts, events and schedule entries, so insert paths funnel through
+# _shared_witnesses and all copies collapse to one frozenset object
+_WITNESS_CACHE: Dict[FrozenSet[str], FrozenSet[str]] = {}
+
+
+def _shared_witnesses(witnesses) -> FrozenSet[str]:
+    # Members interned: the same names recur across every witness set and
+    # membership tests hit the identity fast-path on interned keys
+    fs = frozenset(map(sys.intern, witnesses)) if witnesses else frozenset()
+    return _WITNESS_CACHE.setdefault(fs, fs)
+
+
+# All world models are hot internal containers with no external
+# validation need; slotted dataclasses skip pydantic's per-model validator
+# machinery and the per-instance __dict__, which matters once a long
+# session has accumulated thousands of them.
+
+@dataclass(slots=True)
+class Fact:
     """Represents a fact in the game world"""
     key: str
     value: Any
@@ -18,28 +48,30 @@ class Fact(BaseModel):
     timestamp: Optional[str] = None
     source: str = "world"  # Who established this fact
     is_public: bool = True  # Whether this fact is common knowledge
-    witnesses: List[str] = Field(default_factory=list)  # Who knows this fact
+    witnesses: FrozenSet[str] = field(default_factory=frozenset)  # Who knows this fact
     # NEW: Link to events and schedule
     event_id: Optional[str] = None  # Which event does this fact relate to?
     schedule_day: Optional[int] = None  # Which day on schedule?
     schedule_period: Optional[str] = None  # Which time period?
 
 
-class Event(BaseModel):
+@dataclass(slots=True)
+class Event:
     """Represents an event that occurred in the game world"""
     event_id: str
     description: str
     timestamp: str
     location: str
-    participants: List[str] = Field(default_factory=list)
-    witnesses: List[str] = Field(default_factory=list)
-    details: Dict[str, Any] = Field(default_factory=dict)
+    participants: List[str] = field(default_factory=list)
+    witnesses: FrozenSet[str] = field(default_factory=frozenset)
+    details: Dict[str, Any] = field(default_factory=dict)
     # NEW: Event sequencing
     sequence_order: int = 0  # Order within the same time period (0 = first, 1 = second, etc.)
     caused_by: Optional[str] = None  # event_id that caused this event
 
 
-class Relationship(BaseModel):
+@dataclass(slots=True)
+class Relationship:
     """Represents a relationship between two characters"""
     character_a: str
     character_b: str
@@ -49,41 +81,103 @@ class Relationship(BaseModel):
     is_public: bool = True
 
 
-class TimeBlock(BaseModel):
+class TimeBlock(NamedTuple):
     """Represents a specific time period in the game"""
     day: int  # Day number (1, 2, 3, etc.)
-    period: str  # "early_morning", "morning", "noon", "afternoon", "evening", "late_night", "overnight"
-    
-    def __str__(self) -> str:
-        return f"Day {self.day} - {self.period.replace('_', ' ').title()}"
-    
-    def __hash__(self) -> int:
-        return hash((self.day, self.period))
-    
-    def __eq__(self, other) -> bool:
-        if not isinstance(other, TimeBlock):
-            return False
-        return self.day == other.day and self.period == other.period
+    period: str  # "early_morning", "morning", "noon", "afternoon", "early_evening", "evening", "night", "late_night", "overnight"
+
 
+def format_time_block(tb: TimeBlock) -> str:
+    """Human-readable label for a time block, e.g. "Day 1 - Late Night"."""
+    return f"Day {tb.day} - {tb.period.replace('_', ' ').title()}"
 
-class NPCScheduleEntry(BaseModel):
+
+@dataclass(slots=True)
+class NPCScheduleEntry:
     """Represents what an NPC was doing during a specific time block"""
     character: str
     time_block: TimeBlock
     location: str
     activity: str
-    with_characters: List[str] = Field(default_factory=list)  # Who else was present
+    with_characters: List[str] = field(default_factory=list)  # Who else was present
     is_public: bool = True  # Whether this information is commonly known
-    witnesses: List[str] = Field(default_factory=list)  # Who can verify this
+    witnesses: FrozenSet[str] = field(default_factory=frozenset)  # Who can verify this
     notes: str = ""  # Additional context
 
 
+
+# Lightweight scenario-record structs: field order mirrors the positional
+# signature of the matching add_* method, so bulk_load can splat each
+# record straight into a call with no kwargs-dict allocation. Scenario
+# modules build their data tables from these instead of dicts.
+
+class FactRecord(NamedTuple):
+    key: str
+    value: Any
+    category: str = "general"
+    is_public: bool = True
+    witnesses: Optional[Sequence[str]] = None
+    source: str = "world"
+    timestamp: Optional[str] = None
+    event_id: Optional[str] = None
+    schedule_day: Optional[int] = None
+    schedule_period: Optional[str] = None
+
+
+class EventRecord(NamedTuple):
+    event_id: str
+    description: str
+    timestamp: str
+    location: str
+    participants: Optional[Sequence[str]] = None
+    witnesses: Optional[Sequence[str]] = None
+    details: Optional[Dict[str, Any]] = None
+    sequence_order: int = 0
+    caused_by: Optional[str] = None
+
+
+class ScheduleRecord(NamedTuple):
+    character: str
+    day: int
+    period: str
+    location: str
+    activity: str
+    with_characters: Optional[Sequence[str]] = None
+    is_public: bool = True
+    witnesses: Optional[Sequence[str]] = None
+    notes: str = ""
+
+
+class RelationshipRecord(NamedTuple):
+    char_a: str
+    char_b: str
+    rel_type: str
+    description: str
+    strength: int = 5
+    is_public: bool = True
+
 class WorldState:
     """
     Manages the state of the game world including all facts, events, and relationships.
     This serves as the ground truth that NPCs must respect when making claims.
     """
-    
+
+    # Shared across all instances; __slots__ keeps instances dict-free
+    time_periods: ClassVar[Tuple[str, ...]] = TIME_PERIODS
+
+    __slots__ = (
+        "facts", "events", "relationships", "locations", "characters",
+        "npc_schedules", "current_day", "current_period",
+        "_world_version", "_public_fact_count", "_schedule_entry_count",
+        "_occupants", "_contradiction_index", "_locations_lower",
+        "_facts_lower", "_rel_by_char", "_events_by_location",
+        "_events_by_character", "_facts_by_category", "_public_fact_keys",
+        "_private_facts_by_witness", "_facts_by_event", "_facts_by_schedule",
+        "_events_by_timestamp", "_period_order", "_schedule_by_char_day_period",
+        "_chars_at", "_export_cache", "_location_lower",
+        "_proj_fact", "_proj_event", "_schedule_by_char_day", "_summary_cache",
+    )
+
     def __init__(self):
         self.facts: Dict[str, Fact] = {}
         self.events: Dict[str, Event] = {}
@@ -93,9 +187,83 @@ class WorldState:
         
         # Timeline and schedule tracking
         self.npc_schedules: Dict[str, List[NPCScheduleEntry]] = {}  # character -> list of schedule entries
-        self.time_periods = ["early_morning", "morning", "noon", "afternoon", "evening", "late_night", "overnight"]
+        # period name -> chronological rank, so schedule ordering never
+        # calls list.index per entry
+        self._period_order = PERIOD_INDEX
+        # (character, day, period) -> entry for O(1) "where were you" lookups
+        self._schedule_by_char_day_period: Dict[tuple, NPCScheduleEntry] = {}
+        # character -> day -> entries sorted by period, so day-filtered
+        # schedule queries skip the scan over the character's other days
+        self._schedule_by_char_day: Dict[str, Dict[int, List[NPCScheduleEntry]]] = {}
+        # (location, day, period) -> characters placed there, the reverse
+        # of the slot table, so occupancy queries skip the roster walk
+        self._chars_at: Dict[tuple, List[str]] = {}
+        # character -> (world version, exported knowledge); stale entries
+        # are detected by version mismatch, so writes need no cache sweep
+        self._export_cache: Dict[str, tuple] = {}
+        # Export row projections built once at insert time, so a knowledge
+        # export references existing row dicts instead of allocating one
+        # per fact/event on every cache miss
+        self._proj_fact: Dict[str, Dict[str, Any]] = {}
+        self._proj_event: Dict[str, Dict[str, Any]] = {}
+        # (world version, summary dict) served while the world is unchanged
+        self._summary_cache: Optional[tuple] = None
         self.current_day = 1
         self.current_period = "afternoon"
+
+        # Bumped on every mutation; callers can cache derived views keyed on
+        # this counter and skip recomputation while the world is unchanged
+        self._world_version = 0
+
+        # Maintained incrementally so get_world_summary never rescans
+        self._public_fact_count = 0
+        self._schedule_entry_count = 0
+
+        # Sorted roster excluding the player, kept current by add_character so
+        # console views never refilter/resort the character set
+        self._occupants: List[str] = []
+
+        # fact_key -> keys it cannot be true alongside; lets contradiction
+        # checks index straight to known-conflicting claims instead of
+        # scanning all pairs
+        self._contradiction_index: Dict[str, List[str]] = {}
+
+        # Lowercased location names, maintained by add_location so claim
+        # validation does one set probe instead of lowering every location
+        self._locations_lower: Set[str] = set()
+        # location -> its lowercased form, computed once at ingress so
+        # case-insensitive claim checks never re-lower stored names
+        self._location_lower: Dict[str, str] = {}
+        # Lowercased fact values, maintained at insert so claim validation
+        # never re-lowers world truth per comparison
+        self._facts_lower: Dict[str, str] = {}
+
+        # Adjacency index: character -> relationships they appear in, so
+        # per-character lookups never scan the full relationship list
+        self._rel_by_char: Dict[str, List[Relationship]] = {}
+
+        # Secondary event indexes maintained by add_event; queries scale
+        # with events-per-location/character instead of total events
+        self._events_by_location: Dict[str, List[Event]] = {}
+        self._events_by_character: Dict[str, List[Event]] = {}
+
+        # Fact indexes for query_facts: per-category lists plus the set of
+        # public fact keys, maintained on insert/overwrite
+        self._facts_by_category: Dict[str, List[Fact]] = {}
+        self._public_fact_keys: Set[str] = set()
+
+        # witness -> private fact keys they know, so knowledge export can
+        # enumerate a character's facts instead of testing every fact
+        self._private_facts_by_witness: Dict[str, Set[str]] = {}
+
+        # Facts linked to an event or a schedule slot, so those queries
+        # read an index instead of scanning the whole fact table
+        self._facts_by_event: Dict[str, List[Fact]] = {}
+        self._facts_by_schedule: Dict[tuple, List[Fact]] = {}
+
+        # timestamp -> events kept sorted by sequence_order on insert, so
+        # timeline queries avoid a full scan plus a per-call sort
+        self._events_by_timestamp: Dict[str, List[Event]] = {}
         
     def add_fact(self, key: str, value: Any, category: str = "general", 
                  is_public: bool = True, witnesses: Optional[List[str]] = None,
@@ -104,56 +272,96 @@ class WorldState:
                  schedule_day: Optional[int] = None,
                  schedule_period: Optional[str] = None) -> None:
         """Add or update a fact in the world state"""
+        previous = self.facts.get(key)
+        if previous is not None:
+            # Value-only update: when every index-bearing field is unchanged
+            # (category, visibility, witnesses, event/schedule links), the
+            # existing Fact stays in all its index lists and is mutated in
+            # place instead of being rebuilt and re-filed
+            if (previous.category == category
+                    and previous.is_public == is_public
+                    and previous.witnesses == _shared_witnesses(witnesses)
+                    and previous.event_id == event_id
+                    and previous.schedule_day == schedule_day
+                    and previous.schedule_period == schedule_period):
+                previous.value = value
+                previous.source = source
+                previous.timestamp = timestamp
+                self._facts_lower[key] = str(value).lower()
+                self._proj_fact[key]["value"] = value
+                self._world_version += 1
+                return
+            if previous.is_public:
+                self._public_fact_count -= 1
+                self._public_fact_keys.discard(key)
+            else:
+                for witness in previous.witnesses:
+                    self._private_facts_by_witness[witness].discard(key)
+            self._facts_by_category[previous.category].remove(previous)
+            if previous.event_id is not None:
+                self._facts_by_event[previous.event_id].remove(previous)
+            if previous.schedule_day is not None and previous.schedule_period is not None:
+                self._facts_by_schedule[(previous.schedule_day, previous.schedule_period)].remove(previous)
+        if is_public:
+            self._public_fact_count += 1
+            self._public_fact_keys.add(key)
         self.facts[key] = Fact(
             key=key,
             value=value,
             category=category,
             is_public=is_public,
-            witnesses=witnesses or [],
+            witnesses=_shared_witnesses(witnesses),
             source=source,
             timestamp=timestamp,
             event_id=event_id,
             schedule_day=schedule_day,
             schedule_period=schedule_period
         )
+        self._facts_by_category.setdefault(category, []).append(self.facts[key])
+        if event_id is not None:
+            self._facts_by_event.setdefault(event_id, []).append(self.facts[key])
+        if schedule_day is not None and schedule_period is not None:
+            self._facts_by_schedule.setdefault((schedule_day, schedule_period), []).append(self.facts[key])
+        if not is_public:
+            for witness in self.facts[key].witnesses:
+                self._private_facts_by_witness.setdefault(witness, set()).add(key)
+        self._facts_lower[key] = str(value).lower()
+        self._proj_fact[key] = {"key": key, "value": value, "category": category}
+        self._world_version += 1
         
     def get_fact(self, key: str) -> Optional[Any]:
         """Retrieve a fact value by key"""
         fact = self.facts.get(key)
         return fact.value if fact else None
     
+    def get_facts(self, keys) -> Dict[str, Any]:
+        """Bulk fact lookup: one pass returning {key: value} for the keys present"""
+        facts = self.facts
+        return {key: facts[key].value for key in keys if key in facts}
+
     def get_fact_details(self, key: str) -> Optional[Fact]:
         """Retrieve full fact details"""
         return self.facts.get(key)
     
     def query_facts(self, category: Optional[str] = None, 
                    is_public: Optional[bool] = None) -> List[Fact]:
-        """Query facts by category and/or visibility"""
-        results = list(self.facts.values())
-        
+        """Query facts by category and/or visibility, from the indexes"""
         if category:
-            results = [f for f in results if f.category == category]
+            results = self._facts_by_category.get(category, [])
+            if is_public is not None:
+                return [f for f in results if f.is_public == is_public]
+            return list(results)
         
-        if is_public is not None:
-            results = [f for f in results if f.is_public == is_public]
-            
-        return results
+        if is_public is None:
+            return list(self.facts.values())
+        return [f for f in self.facts.values() if f.is_public == is_public]
     
     def character_knows_fact(self, character: str, fact_key: str) -> bool:
         """Check if a character should know a particular fact"""
-        fact = self.facts.get(fact_key)
-        if not fact:
-            return False
-        
-        # Public facts are known to all
-        if fact.is_public:
-            return True
-        
-        # Check if character is a witness
-        if character in fact.witnesses:
-            return True
-            
-        return False
+        # Pure index probes: public keys and the per-witness key sets are
+        # maintained by add_fact, so no Fact object is touched here
+        return (fact_key in self._public_fact_keys
+                or fact_key in self._private_facts_by_witness.get(character, ()))
     
     def add_event(self, event_id: str, description: str, timestamp: str,
                  location: str, participants: Optional[List[str]] = None,
@@ -162,24 +370,39 @@ class WorldState:
                  sequence_order: int = 0,
                  caused_by: Optional[str] = None) -> None:
         """Add an event to the timeline"""
-        self.events[event_id] = Event(
+        location = sys.intern(location)
+        event = Event(
             event_id=event_id,
             description=description,
             timestamp=timestamp,
             location=location,
-            participants=participants or [],
-            witnesses=witnesses or [],
+            participants=[sys.intern(p) for p in participants] if participants else [],
+            witnesses=_shared_witnesses(witnesses),
             details=details or {},
             sequence_order=sequence_order,
             caused_by=caused_by
         )
+        self.events[event_id] = event
+        self._proj_event[event_id] = {
+            "id": event_id,
+            "description": description,
+            "timestamp": timestamp,
+            "location": location
+        }
+        self._events_by_location.setdefault(location, []).append(event)
+        insort(self._events_by_timestamp.setdefault(timestamp, []),
+               event, key=lambda e: e.sequence_order)
         
-        # Add location and characters to tracking
+        # Add location and characters to tracking; anyone involved gets the
+        # event filed under their name exactly once
         self.locations.add(location)
-        for char in (participants or []):
-            self.characters.add(char)
-        for char in (witnesses or []):
-            self.characters.add(char)
+        self._locations_lower.add(self._location_lower.setdefault(location, location.lower()))
+        involved = set(participants or [])
+        involved.update(witnesses or [])
+        for char in involved:
+            self._track_character(char)
+            self._events_by_character.setdefault(char, []).append(event)
+        self._world_version += 1
     
     def get_event(self, event_id: str) -> Optional[Event]:
         """Retrieve an event by ID"""
@@ -187,56 +410,72 @@ class WorldState:
     
     def get_events_at_location(self, location: str) -> List[Event]:
         """Get all events that occurred at a specific location"""
-        return [e for e in self.events.values() if e.location == location]
+        return self._events_by_location.get(location, [])
     
     def get_events_with_character(self, character: str) -> List[Event]:
         """Get all events involving a character (as participant or witness)"""
-        return [
-            e for e in self.events.values() 
-            if character in e.participants or character in e.witnesses
-        ]
+        return self._events_by_character.get(character, [])
     
     def add_relationship(self, char_a: str, char_b: str, rel_type: str,
                         description: str, strength: int = 5, 
                         is_public: bool = True) -> None:
         """Add a relationship between two characters"""
-        self.relationships.append(Relationship(
+        char_a = sys.intern(char_a)
+        char_b = sys.intern(char_b)
+        relationship = Relationship(
             character_a=char_a,
             character_b=char_b,
             relationship_type=rel_type,
             description=description,
             strength=strength,
             is_public=is_public
-        ))
+        )
+        self.relationships.append(relationship)
+        self._rel_by_char.setdefault(char_a, []).append(relationship)
+        self._rel_by_char.setdefault(char_b, []).append(relationship)
         
         # Add characters to tracking
-        self.characters.add(char_a)
-        self.characters.add(char_b)
+        self._track_character(char_a)
+        self._track_character(char_b)
+        self._world_version += 1
     
     def get_relationships(self, character: str) -> List[Relationship]:
         """Get all relationships involving a character"""
-        return [
-            r for r in self.relationships 
-            if r.character_a == character or r.character_b == character
-        ]
+        return self._rel_by_char.get(character, [])
     
     def get_relationship_between(self, char_a: str, char_b: str) -> List[Relationship]:
         """Get relationships between two specific characters"""
         return [
-            r for r in self.relationships
-            if (r.character_a == char_a and r.character_b == char_b) or
-               (r.character_a == char_b and r.character_b == char_a)
+            r for r in self._rel_by_char.get(char_a, ())
+            if r.character_a == char_b or r.character_b == char_b
         ]
     
     def add_location(self, location: str) -> None:
         """Add a location to the world"""
+        location = sys.intern(location)
         self.locations.add(location)
+        self._locations_lower.add(self._location_lower.setdefault(location, location.lower()))
+        self._world_version += 1
     
+    def _track_character(self, character: str) -> str:
+        """Record a character (interned), keeping the sorted occupant view in step"""
+        character = sys.intern(character)
+        if character not in self.characters:
+            self.characters.add(character)
+            if character != "Investigator":
+                insort(self._occupants, character)
+        return character
+
     def add_character(self, character: str) -> None:
         """Register a character in the world"""
-        self.characters.add(character)
+        character = self._track_character(character)
         if character not in self.npc_schedules:
             self.npc_schedules[character] = []
+        self._world_version += 1
+
+    def get_occupants(self) -> Sequence[str]:
+        """All known characters except the Investigator, already sorted"""
+        return self._occupants
     
     def add_schedule_entry(
         self,
@@ -256,7 +495,7 @@ class WorldState:
         Args:
             character: Name of the character
             day: Day number (1, 2, 3, etc.)
-            period: Time period ("early_morning", "morning", "noon", "afternoon", "evening", "late_night", "overnight")
+            period: Time period ("early_morning", "morning", "noon", "afternoon", "early_evening", "evening", "night", "late_night", "overnight")
             location: Where the character was
             activity: What they were doing
             with_characters: Who else was present with them
@@ -264,22 +503,20 @@ class WorldState:
             witnesses: Who can verify this (includes the character themselves by default)
             notes: Additional context
         """
-        if period not in self.time_periods:
-            raise ValueError(f"Invalid period '{period}'. Must be one of: {self.time_periods}")
+        if period not in TIME_PERIODS_SET:
+            raise ValueError(f"Invalid period '{period}'. Must be one of: {list(TIME_PERIODS)}")
         
+        character = sys.intern(character)
         self.add_character(character)
+        location = sys.intern(location)
+        self._location_lower.setdefault(location, location.lower())
         
         time_block = TimeBlock(day=day, period=period)
         
-        # Add character to witnesses if not already there
-        all_witnesses = list(witnesses) if witnesses else []
-        if character not in all_witnesses:
-            all_witnesses.append(character)
-        
-        # Add companions to witnesses
-        for companion in (with_characters or []):
-            if companion not in all_witnesses:
-                all_witnesses.append(companion)
+        # Witness set always includes the character and any companions
+        all_witnesses = set(witnesses) if witnesses else set()
+        all_witnesses.add(character)
+        all_witnesses.update(with_characters or [])
         
         entry = NPCScheduleEntry(
             character=character,
@@ -288,54 +525,90 @@ class WorldState:
             activity=activity,
             with_characters=with_characters or [],
             is_public=is_public,
-            witnesses=all_witnesses,
+            witnesses=_shared_witnesses(all_witnesses),
             notes=notes
         )
         
-        self.npc_schedules[character].append(entry)
+        period_order = self._period_order
+        insort(self.npc_schedules[character], entry,
+               key=lambda e: (e.time_block.day, period_order[e.time_block.period]))
+        insort(self._schedule_by_char_day.setdefault(character, {}).setdefault(day, []),
+               entry, key=lambda e: period_order[e.time_block.period])
+        # setdefault keeps the first entry for a slot, matching the old
+        # first-match scan when a slot was filed twice; the reverse index
+        # only records the entry that actually claimed the slot
+        if self._schedule_by_char_day_period.setdefault((character, day, period), entry) is entry:
+            self._chars_at.setdefault((location, day, period), []).append(character)
+        self._schedule_entry_count += 1
+        self._world_version += 1
     
+    def bulk_load(self, facts=(), events=(), schedule=(), relationships=(),
+                  locations=(), characters=(), contradictions=()) -> None:
+        """
+        Batched insert: load whole scenario tables in one pass.
+
+        Each entry is a *Record struct (or legacy kwargs dict) for the
+        corresponding add_* method, so a
+        scenario can declare its data once at module scope and hand it over
+        in a single call instead of dozens of scattered inserts. Routing
+        through the single-insert helpers keeps every maintained counter and
+        view (public-fact count, occupant list, schedules) consistent.
+        """
+        # Bound methods hoisted out of the loops; record tuples splat
+        # positionally so no per-call kwargs dict is ever built
+        add_fact = self.add_fact
+        add_event = self.add_event
+        add_schedule_entry = self.add_schedule_entry
+        add_relationship = self.add_relationship
+        for location in locations:
+            self.locations.add(location)
+            self._locations_lower.add(self._location_lower.setdefault(location, location.lower()))
+        for character in characters:
+            self.add_character(character)
+        for rec in facts:
+            add_fact(*rec) if isinstance(rec, tuple) else add_fact(**rec)
+        for rec in events:
+            add_event(*rec) if isinstance(rec, tuple) else add_event(**rec)
+        for rec in schedule:
+            add_schedule_entry(*rec) if isinstance(rec, tuple) else add_schedule_entry(**rec)
+        for rec in relationships:
+            add_relationship(*rec) if isinstance(rec, tuple) else add_relationship(**rec)
+        for rec in contradictions:
+            self.add_contradiction_rule(*rec)
+        self._world_version += 1
+
     def get_character_schedule(self, character: str, day: Optional[int] = None) -> List[NPCScheduleEntry]:
         """Get schedule entries for a character, optionally filtered by day"""
         if character not in self.npc_schedules:
             return []
         
-        entries = self.npc_schedules[character]
-        
+        # Entries are kept in chronological order at insert time
         if day is not None:
-            entries = [e for e in entries if e.time_block.day == day]
+            days = self._schedule_by_char_day.get(character)
+            return list(days.get(day, ())) if days else []
         
-        return sorted(entries, key=lambda e: (e.time_block.day, self.time_periods.index(e.time_block.period)))
+        return list(self.npc_schedules[character])
     
     def query_facts_by_event(self, event_id: str) -> List[Fact]:
-        """Get all facts associated with a specific event"""
-        return [fact for fact in self.facts.values() if fact.event_id == event_id]
+        """Get all facts associated with a specific event (indexed)"""
+        return list(self._facts_by_event.get(event_id, ()))
     
     def query_facts_by_schedule(self, day: int, period: str) -> List[Fact]:
-        """Get all facts from a specific schedule time"""
-        return [fact for fact in self.facts.values() 
-                if fact.schedule_day == day and fact.schedule_period == period]
+        """Get all facts from a specific schedule time (indexed)"""
+        return list(self._facts_by_schedule.get((day, period), ()))
     
     def get_events_in_sequence(self, timestamp: str) -> List[Event]:
         """Get all events at a timestamp, ordered by sequence_order"""
-        events = [e for e in self.events.values() if e.timestamp == timestamp]
-        return sorted(events, key=lambda e: e.sequence_order)
+        return list(self._events_by_timestamp.get(timestamp, ()))
     
     def get_character_location_at_time(self, character: str, day: int, period: str) -> Optional[str]:
         """Get where a character was during a specific time period"""
-        entries = self.get_character_schedule(character, day)
-        for entry in entries:
-            if entry.time_block.period == period:
-                return entry.location
-        return None
+        entry = self._schedule_by_char_day_period.get((character, day, period))
+        return entry.location if entry is not None else None
     
     def get_characters_at_location_time(self, location: str, day: int, period: str) -> List[str]:
         """Get all characters who were at a specific location during a time period"""
-        characters = []
-        for char in self.characters:
-            char_location = self.get_character_location_at_time(char, day, period)
-            if char_location == location:
-                characters.append(char)
-        return characters
+        return list(self._chars_at.get((location, day, period), ()))
     
     def verify_character_claim_time_location(
         self,
@@ -355,56 +628,81 @@ class WorldState:
         if actual_location is None:
             return True, None  # No schedule entry, can't contradict
         
-        is_valid = actual_location.lower() == claimed_location.lower()
+        # Stored side comes pre-lowered from the ingress map; only the
+        # player's claim is lowered per call
+        is_valid = self._location_lower[actual_location] == claimed_location.lower()
         return is_valid, actual_location
     
+    def add_contradiction_rule(self, fact_key_a: str, fact_key_b: str,
+                               kind: str = "mutually_exclusive") -> None:
+        """
+        Declare two fact keys as conflicting testimony.
+
+        Scenario authors know which claims cannot all be true; recording the
+        pairs up front lets dialogue-time checks look up conflicts in O(1)
+        instead of re-deriving them with a pairwise scan. `kind` is kept for
+        future constraint flavors; only mutual exclusion exists today.
+        """
+        self._contradiction_index.setdefault(fact_key_a, []).append(fact_key_b)
+        self._contradiction_index.setdefault(fact_key_b, []).append(fact_key_a)
+        self._world_version += 1
+
+    def get_contradicting_facts(self, fact_key: str) -> List[str]:
+        """Fact keys declared mutually exclusive with the given one"""
+        return self._contradiction_index.get(fact_key, [])
+
     def get_world_summary(self) -> Dict[str, Any]:
-        """Get a summary of the current world state"""
-        total_schedule_entries = sum(len(entries) for entries in self.npc_schedules.values())
-        
-        return {
-            "total_facts": len(self.facts),
+        """Get a summary of the current world state from O(1) counters"""
+        # Polled views (status panes) hit this every tick; the location and
+        # character list copies are only rebuilt after a mutation
+        cached = self._summary_cache
+        if cached is not None and cached[0] == self._world_version:
+            return cached[1]
+
+        total_facts = len(self.facts)
+        summary = {
+            "total_facts": total_facts,
             "total_events": len(self.events),
             "total_relationships": len(self.relationships),
-            "total_schedule_entries": total_schedule_entries,
+            "total_schedule_entries": self._schedule_entry_count,
             "locations": list(self.locations),
             "characters": list(self.characters),
-            "public_facts": len([f for f in self.facts.values() if f.is_public]),
-            "private_facts": len([f for f in self.facts.values() if not f.is_public]),
+            "public_facts": self._public_fact_count,
+            "private_facts": total_facts - self._public_fact_count,
             "current_time": f"Day {self.current_day} - {self.current_period}"
         }
+        self._summary_cache = (self._world_version, summary)
+        return summary
     
     def export_character_knowledge(self, character: str) -> Dict[str, Any]:
         """
         Export all facts, events, and relationships that a specific character knows.
         This is used to provide context to the AI agent.
         """
-        known_facts = [
-            f for f in self.facts.values()
-            if self.character_knows_fact(character, f.key)
-        ]
-        
-        known_events = self.get_events_with_character(character)
-        
-        relationships = self.get_relationships(character)
-        
-        # Get character's schedule
-        schedule = self.get_character_schedule(character)
+        # Per-turn assembly path: during a conversation the world usually
+        # does not change between calls, so serve the cached export while
+        # the version it was built against still matches
+        cached = self._export_cache.get(character)
+        if cached is not None and cached[0] == self._world_version:
+            return cached[1]
+
+        # Single pass per section, straight off the maintained indexes:
+        # public facts plus this character's private keys, their event and
+        # relationship adjacency lists, and the sorted schedule. Fact and
+        # event rows reference the projections built at insert time; no
+        # per-row dict is allocated here
+        proj_fact = self._proj_fact
+        known_facts = list(map(proj_fact.__getitem__, self._public_fact_keys))
+        known_facts.extend(
+            map(proj_fact.__getitem__,
+                self._private_facts_by_witness.get(character, ())))
         
-        return {
+        knowledge = {
             "character": character,
-            "known_facts": [
-                {"key": f.key, "value": f.value, "category": f.category}
-                for f in known_facts
-            ],
+            "known_facts": known_facts,
             "known_events": [
-                {
-                    "id": e.event_id,
-                    "description": e.description,
-                    "timestamp": e.timestamp,
-                    "location": e.location
-                }
-                for e in known_events
+                self._proj_event[e.event_id]
+                for e in self._events_by_character.get(character, ())
             ],
             "relationships": [
                 {
@@ -412,16 +710,35 @@ class WorldState:
                     "type": r.relationship_type,
                     "description": r.description
                 }
-                for r in relationships
+                for r in self._rel_by_char.get(character, ())
             ],
             "schedule": [
                 {
-                    "time": str(entry.time_block),
+                    "time": format_time_block(entry.time_block),
                     "location": entry.location,
                     "activity": entry.activity,
                     "with": entry.with_characters,
                     "notes": entry.notes
                 }
-                for entry in schedule
+                for entry in self.get_character_schedule(character)
             ]
         }
+        self._export_cache[character] = (self._world_version, knowledge)
+        return knowledge
+
+    def export_knowledge_batch(self, characters: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Export knowledge for several characters in one call.
+
+        The per-turn dialogue loop only ever needs one speaker, so this is
+        for scene-wide refreshes and scenario tooling. Exports are
+        independent per character, so DIALOGUE_PARALLEL_CONTEXT=1 runs them
+        on a thread pool (worthwhile mainly when callers overlap this with
+        outbound AI calls); the default is a plain loop.
+        """
+        export = self.export_character_knowledge
+        if os.getenv("DIALOGUE_PARALLEL_CONTEXT") == "1" and len(characters) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(4, len(characters))) as pool:
+                return dict(zip(characters, pool.map(export, characters)))
+        return {character: export(character) for character in characters}